@@ -0,0 +1,51 @@
+"""Compare two ``benchmarks.run`` JSON reports stage by stage.
+
+    uv run python -m benchmarks.compare base.json head.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+
+def _stages(report: dict) -> dict:
+    return {
+        (result["rows"], stage["name"]): stage
+        for result in report["results"]
+        for stage in result["stages"]
+    }
+
+
+def compare(base: dict, head: dict, threshold: float = 1.1) -> list:
+    """Rows of (rows, stage, base s, head s, ratio, flagged) for stages in both reports."""
+    base_stages = _stages(base)
+    out = []
+    for key, stage in _stages(head).items():
+        if key not in base_stages:
+            continue
+        before = base_stages[key]["seconds"]
+        after = stage["seconds"]
+        ratio = after / before if before else float("inf")
+        out.append((*key, before, after, ratio, ratio > threshold))
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark reports")
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument("--threshold", type=float, default=1.1, help="flag stages slower than this ratio")
+    args = parser.parse_args(argv)
+
+    base = json.loads(args.base.read_text())
+    head = json.loads(args.head.read_text())
+    print(f"{base['commit']} -> {head['commit']}")
+    if base.get("memory_traced") != head.get("memory_traced"):
+        print("warning: only one report was run with memory tracing; timings are not comparable")
+    for rows, name, before, after, ratio, flagged in compare(base, head, args.threshold):
+        marker = "  <-- slower" if flagged else ""
+        print(f"{rows:>10} {name:<32} {before:>9.3f}s {after:>9.3f}s {ratio:>6.2f}x{marker}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Check each page's import cost against a budget using ``python -X importtime``.
+
+    uv run python -m benchmarks.importtime --budget-ms 1500
+
+For every Streamlit page, the module-level imports are run in a fresh interpreter
+(the page body itself is not executed, so no MongoDB access is needed). The command
+exits non-zero when a page is over budget or loads one of the ``--forbid`` modules,
+which chart functions import lazily.
+"""
+
+import argparse
+import ast
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+PAGES = [
+    ROOT / "st_dashboard" / "🔎_Overview.py",
+    *sorted((ROOT / "st_dashboard" / "pages").glob("[!_]*.py")),
+]
+FORBIDDEN = ["matplotlib", "seaborn", "plotly.express"]
+BUDGET_MS = 1500
+
+
+def page_imports(path: Path) -> str:
+    """The page's module-level import statements as one script."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    nodes = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.unparse(node) for node in nodes)
+
+
+def parse_importtime(stderr: str) -> dict:
+    """``{module: (self_us, cumulative_us)}`` from ``-X importtime`` output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def measure(code: str) -> dict:
+    path = os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")]))
+    env = {**os.environ, "PYTHONPATH": path}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    return parse_importtime(proc.stderr)
+
+
+def check_page(path: Path, repeat: int = 3) -> dict:
+    # The fastest of a few runs; the others mostly measure disk cache and scheduler noise
+    runs = [measure(page_imports(path)) for _ in range(repeat)]
+    modules = min(runs, key=lambda run: sum(s for s, _ in run.values()))
+    total_ms = sum(s for s, _ in modules.values()) / 1000
+    heaviest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:5]
+    return {
+        "page": path.name,
+        "total_ms": total_ms,
+        "modules": modules,
+        "heaviest": [(name, self_us / 1000) for name, (self_us, _) in heaviest],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS, help="per-page import budget")
+    parser.add_argument("--forbid", nargs="*", default=FORBIDDEN, help="modules no page may import")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for path in PAGES:
+        result = check_page(path, repeat=args.repeat)
+        loaded = [name for name in args.forbid if name in result["modules"]]
+        over = result["total_ms"] > args.budget_ms
+        failed |= over or bool(loaded)
+        status = "OVER" if over else "ok"
+        print(f"{result['page']}: {result['total_ms']:.0f} ms / {args.budget_ms:.0f} ms {status}")
+        for name, self_ms in result["heaviest"]:
+            print(f"    {self_ms:8.1f} ms  {name}")
+        if loaded:
+            print(f"    imports {', '.join(loaded)} at page import")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Time each dashboard stage on synthetic jobs and write the results as JSON.
+
+    uv run python -m benchmarks.run --rows 100000 1000000 --out bench.json
+
+Each stage records wall time, output rows and the tracemalloc peak (pass
+``--no-memory`` for timings without tracing overhead). ``decode`` consumes the
+generator, so the ``generate`` stage is reported for subtraction.
+"""
+
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from benchmarks.synthetic import generate_jobs
+from st_dashboard.charts import overview, task_breakdown
+from st_dashboard.data.constants import DEFAULT_TOP_N
+from st_dashboard.data.cube import build_cube, slice_cube, top_titles
+from st_dashboard.data.decode import decode_cursor
+from st_dashboard.data.distributions import build_quality_hist
+from st_dashboard.data.projections import BASE_PROJECTION
+from st_dashboard.data.time_index import TimeIndex
+from st_dashboard.data.transforms import (
+    add_model_columns,
+    add_quality_and_cost,
+    add_time_columns,
+    compact_dataframe,
+)
+
+TASK = "i2i"
+GROUP_COL = "model_type_agg"
+
+
+def _rows(value):
+    return len(value) if isinstance(value, pd.DataFrame) else None
+
+
+class StageTimer:
+    def __init__(self, memory: bool = True):
+        self.memory = memory
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name: str):
+        record = {"name": name}
+        if self.memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = round(time.perf_counter() - started, 6)
+            if self.memory:
+                record["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            self.stages.append(record)
+
+    def run(self, name: str, fn, *args, **kwargs):
+        with self.stage(name) as record:
+            out = fn(*args, **kwargs)
+            record["rows"] = _rows(out)
+        return out
+
+
+def _consume(iterable) -> int:
+    count = 0
+    for _ in iterable:
+        count += 1
+    return count
+
+
+def bench(rows: int, seed: int = 0, memory: bool = True) -> dict:
+    timer = StageTimer(memory=memory)
+    with timer.stage("generate") as record:
+        record["rows"] = _consume(generate_jobs(rows, seed=seed))
+
+    df = timer.run("decode", decode_cursor, generate_jobs(rows, seed=seed), BASE_PROJECTION)
+    df = timer.run("add_time_columns", add_time_columns, df)
+    df = timer.run("add_model_columns", add_model_columns, df)
+    df = timer.run("add_quality_and_cost", add_quality_and_cost, df)
+    df = timer.run("compact_dataframe", compact_dataframe, df)
+
+    cube = timer.run("build_cube", build_cube, df)
+    hist = timer.run("build_quality_hist", build_quality_hist, df)
+    timer.run("time_index", TimeIndex, df)
+    rollup = timer.run("weekly_rollup", overview.weekly_rollup, df, GROUP_COL)
+
+    cells = slice_cube(cube, model_type=TASK)
+    task_hist = slice_cube(hist, model_type=TASK)
+    titles = top_titles(cells, DEFAULT_TOP_N)
+    charts = [
+        ("overview.requests_over_time", overview.requests_over_time, (rollup, GROUP_COL, False)),
+        ("overview.cost_over_time", overview.cost_over_time, (rollup, GROUP_COL, True)),
+        ("overview.jobs_and_cost_bar", overview.jobs_and_cost_bar, (rollup, GROUP_COL)),
+        ("task.usage_over_time", task_breakdown.usage_over_time, (cells, DEFAULT_TOP_N, False)),
+        ("task.cost_over_time", task_breakdown.cost_over_time, (cells, DEFAULT_TOP_N, True)),
+        ("task.quality_boxplot", task_breakdown.quality_boxplot, (task_hist, titles)),
+        ("task.quality_kde", task_breakdown.quality_kde, (task_hist, titles)),
+        ("task.download_rate_bar", task_breakdown.download_rate_bar, (cells, titles)),
+        ("task.avg_cost_bar", task_breakdown.avg_cost_bar, (cells, titles)),
+        ("task.weekly_avg_cost_line", task_breakdown.weekly_avg_cost_line, (cells, titles)),
+        ("task.scatter_quality_cost", task_breakdown.scatter_quality_cost, (cells, titles)),
+    ]
+    for name, fn, args in charts:
+        timer.run(name, fn, *args)
+        plt.close("all")
+
+    return {
+        "rows": rows,
+        "total_seconds": round(sum(s["seconds"] for s in timer.stages if s["name"] != "generate"), 6),
+        "stages": timer.stages,
+    }
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc peaks")
+    parser.add_argument("--out", type=Path, help="JSON output path (default: stdout)")
+    args = parser.parse_args(argv)
+
+    results = []
+    for rows in args.rows:
+        result = bench(rows, seed=args.seed, memory=not args.no_memory)
+        results.append(result)
+        print(f"{rows:>10} rows: {result['total_seconds']:.2f}s", file=sys.stderr)
+
+    report = {
+        "commit": _commit(),
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        # tracemalloc slows Python-heavy stages several-fold; only compare like with like
+        "memory_traced": not args.no_memory,
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "results": results,
+    }
+    payload = json.dumps(report, indent=2)
+    if args.out:
+        args.out.write_text(payload)
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Synthetic ``assetGenJobs`` documents shaped like the ``BASE_PROJECTION`` result."""
+
+from datetime import datetime, timedelta
+from typing import Iterator
+
+import numpy as np
+from bson import ObjectId
+
+# (weight, modelConfig.id, modelConfig.name, modelTitle, provider, openAIModelId)
+# Covers every family in FAMILY_RULES plus titles that fall through to "other".
+MODEL_CATALOG = [
+    (10, "t2i-flux-dev", "Text to Image", "Flux Dev", "REPLICATE", None),
+    (6, "t2i-imagen-4", "Text to Image", "Imagen 4", "REPLICATE", None),
+    (4, "t2i-gpt-image-1", "Text to Image", "GPT Image 1", "OPENAI", None),
+    (3, "t2i-ideogram-v3", "Text to Image", "Ideogram v3", "REPLICATE", None),
+    (12, "i2i-nano-banana", "Image to Image", "Nano Banana", "REPLICATE", None),
+    (8, "i2i-gpt-image", "Image to Image", "GPT Image", "OPENAI", "gpt-image-1"),
+    (2, "i2i-gpt-image", "Image to Image", "GPT Image", "OPENAI", None),
+    (6, "i2i-flux-kontext-pro", "Image to Image", "Flux Kontext Pro", "REPLICATE", None),
+    (10, "i2v-kling-2.1", "Image to Video", "Kling 2.1", "REPLICATE", None),
+    (7, "i2v-seedance-1-pro", "Image to Video", "Seedance 1 Pro", "REPLICATE", None),
+    (5, "i2v-veo-3", "Image to Video", "Veo 3", "REPLICATE", None),
+    (4, "i2v-runway-gen4", "Image to Video", "Runway Gen-4", "RUNWAY", None),
+    (4, "t2v-veo-3-fast", "Text to Video", "Veo 3 Fast", "REPLICATE", None),
+    (3, "t2v-kling-2.1-master", "Text to Video", "Kling 2.1 Master", "REPLICATE", None),
+    (3, "v2v-runway-aleph", "Video to Video", "Runway Aleph", "RUNWAY", None),
+    (5, "t2s-elevenlabs", "Text to Speech", "ElevenLabs", "ELEVENLABS", None),
+    (1, "s2v-omnihuman", "Speech to Video", "OmniHuman", "REPLICATE", None),
+    (1, "minimatic-v1", "Minimatics", "Minimatic", "INTERNAL", None),
+    (1, "sfx-v1", "Sound Effects", "Sound Effects", "ELEVENLABS", None),
+]
+TTS_MODELS = ["eleven_v3", "eleven_multilingual_v2", "eleven_turbo_v2_5"]
+STATUSES = ["completed", "failed", "processing"]
+STATUS_WEIGHTS = [0.85, 0.1, 0.05]
+QC_STATUSES = ["passed", "failed", "skipped"]
+ERROR_CODES = ["TIMEOUT", "PROVIDER_ERROR", "NSFW"]
+COSTS = [0.5, 1.0, 2.0, 4.0, 8.0]
+
+
+def _tts_inputs(choice: str, as_list: bool):
+    # Both shapes _extract_from_inputs accepts, already trimmed like the projection
+    if as_list:
+        return [{"id": "tts_model", "value": choice, "defaultValue": "eleven_v3"}]
+    return {"tts_model": choice}
+
+
+def generate_jobs(
+    n: int,
+    seed: int = 0,
+    start: datetime = datetime(2025, 1, 1),
+    days: int = 180,
+    users: int = 5000,
+    chunk: int = 10000,
+) -> Iterator[dict]:
+    """Yield ``n`` job documents, generated ``chunk`` at a time so none are held in bulk."""
+    rng = np.random.default_rng(seed)
+    weights = np.array([m[0] for m in MODEL_CATALOG], dtype="float64")
+    weights /= weights.sum()
+    span = days * 86400
+    for offset in range(0, n, chunk):
+        size = min(chunk, n - offset)
+        models = rng.choice(len(MODEL_CATALOG), size=size, p=weights)
+        created = np.sort(rng.integers(0, span, size=size))
+        lag = rng.integers(1, 3600, size=size)
+        status = rng.choice(len(STATUSES), size=size, p=STATUS_WEIGHTS)
+        score = rng.uniform(0, 10, size=size).round(2)
+        has_score = rng.random(size) < 0.6
+        downloaded = rng.random(size) < 0.35
+        rewrite = rng.random(size) < 0.2
+        cost = rng.choice(len(COSTS), size=size)
+        user = rng.integers(0, users, size=size)
+        tts = rng.choice(len(TTS_MODELS), size=size)
+        list_inputs = rng.random(size) < 0.5
+        for i in range(size):
+            _, model_id, name, title, provider, openai_id = MODEL_CATALOG[models[i]]
+            created_at = start + timedelta(seconds=int(created[i]))
+            updated_at = created_at + timedelta(seconds=int(lag[i]))
+            failed = STATUSES[status[i]] == "failed"
+            model_config = {
+                "id": model_id,
+                "name": name,
+                "modelTitle": title,
+                "modelType": name,
+                "outputType": "audio" if model_id.startswith("t2s") else "media",
+                "provider": provider,
+                "costConfig": {"defaultCost": COSTS[cost[i]]},
+            }
+            if openai_id is not None:
+                model_config["modelMetaData"] = {"openAIModelId": openai_id}
+            if model_id.startswith("t2s"):
+                model_config["inputs"] = _tts_inputs(TTS_MODELS[tts[i]], bool(list_inputs[i]))
+            doc = {
+                "_id": ObjectId(),
+                "jobId": f"job-{offset + i}",
+                "userId": f"user-{user[i]}",
+                "createdAt": created_at,
+                "updatedAt": updated_at,
+                "status": STATUSES[status[i]],
+                "modelConfig": model_config,
+                "has_rewrite": bool(rewrite[i]),
+            }
+            if has_score[i] and not failed:
+                doc["qualityAnalysis"] = {
+                    "score": float(score[i]),
+                    "transformedScore": float(score[i]) / 10,
+                    "qualityCheckStatus": QC_STATUSES[int(score[i]) % 3],
+                }
+            if downloaded[i] and not failed:
+                doc["resultDownloadedAt"] = updated_at
+            if failed:
+                doc["error"] = {"code": ERROR_CODES[i % len(ERROR_CODES)]}
+            yield doc
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -7,8 +9,57 @@ class Settings(BaseSettings):
     mongo_password: str
     mongo_host: str
 
+    # Directory for the on-disk Parquet snapshot of the enriched frame (disabled when unset)
+    snapshot_dir: str | None = None
+
+    # Documents decoded per batch while reading a cursor, and an optional ceiling (bytes)
+    # on the decoded frame so a refresh cannot exhaust a worker's memory
+    fetch_batch_size: int = 5000
+    fetch_max_bytes: int | None = None
+
+    # Full reads are split into this many concurrent createdAt ranges, each with its
+    # own server-side time limit and retries (1 disables sharding)
+    fetch_shards: int = 4
+    fetch_shard_timeout_ms: int = 10000
+    fetch_shard_retries: int = 2
+
+    # Seconds between background refreshes of the loaded task data; page requests
+    # never refresh themselves, they read the last refreshed copy
+    refresh_interval_seconds: int = 600
+
+    # Apply change-stream events to the loaded data instead of polling (needs a replica set)
+    live_ingest: bool = False
+
+    # Log per-stage timing spans as JSON lines (the sidebar debug panel works without it)
+    log_spans: bool = False
+
+    # Enrich frames of at least enrich_min_rows across this many worker processes
+    # (1 keeps enrichment in-process)
+    enrich_workers: int = 1
+    enrich_min_rows: int = 200_000
+
+    # Fetch aggregates from a local `python -m st_dashboard.data.service` process
+    # instead of reading MongoDB in every Streamlit worker
+    aggregate_server_url: str | None = None
+    aggregate_timeout_seconds: float = 30
+
+    # Byte budget for rendered chart payloads (Plotly JSON / Matplotlib PNG)
+    render_cache_bytes: int = 64 * 1024 * 1024
+
     @property
     def mongo_uri(self) -> str:
         return f"mongodb+srv://{self.mongo_user}:{self.mongo_password}@{self.mongo_host}/?retryWrites=true&w=majority"
 
-settings = Settings()
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """The process-wide settings, read from the environment / ``.env`` on first use."""
+    return Settings()
+
+
+def __getattr__(name):
+    # `from config.settings import settings` keeps working, but the environment is
+    # only read (and validated) when something first asks for it
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,5 @@
 from pymongo import MongoClient
-from config.settings import settings
+from config.settings import get_settings
 
 _client = None
 
@@ -7,7 +7,7 @@ def get_client():
     global _client
     if _client is None:
         _client = MongoClient(
-            settings.mongo_uri,
+            get_settings().mongo_uri,
             serverSelectionTimeoutMS=5000,
             connectTimeoutMS=5000,
             socketTimeoutMS=10000,
@@ -1,9 +1,9 @@
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 
 
 def _stacked_area(df_long, x_col, y_col, color_col, percent, title, y_title):
+    import plotly.express as px
+
     fig = px.area(
         df_long,
         x=x_col,
@@ -24,7 +24,7 @@ def _stacked_area(df_long, x_col, y_col, color_col, percent, title, y_title):
 
 def weekly_counts(df: pd.DataFrame, group_col: str) -> pd.DataFrame:
     return (
-        df.groupby(["week_start", group_col])
+        df.groupby(["week_start", group_col], observed=True)
         .size()
         .reset_index(name="count")
     )
@@ -32,14 +32,24 @@ def weekly_counts(df: pd.DataFrame, group_col: str) -> pd.DataFrame:
 
 def weekly_costs(df: pd.DataFrame, group_col: str) -> pd.DataFrame:
     return (
-        df.groupby(["week_start", group_col])["default_cost"]
+        df.groupby(["week_start", group_col], observed=True)["default_cost"]
         .sum()
         .reset_index(name="cost")
     )
 
 
-def requests_over_time(df: pd.DataFrame, group_col: str, percent: bool):
-    df_long = weekly_counts(df, group_col)
+def weekly_rollup(df: pd.DataFrame, group_col: str) -> pd.DataFrame:
+    """Row-level frame -> (week_start, group_col, count, cost), the shape the charts consume.
+
+    ``aggregates.run_weekly_rollup`` returns the same shape straight from MongoDB.
+    """
+    return weekly_counts(df, group_col).merge(
+        weekly_costs(df, group_col), on=["week_start", group_col], how="left"
+    )
+
+
+def requests_over_time(rollup: pd.DataFrame, group_col: str, percent: bool):
+    df_long = rollup[["week_start", group_col, "count"]]
     return _stacked_area(
         df_long,
         x_col="week_start",
@@ -51,8 +61,8 @@ def requests_over_time(df: pd.DataFrame, group_col: str, percent: bool):
     )
 
 
-def cost_over_time(df: pd.DataFrame, group_col: str, percent: bool):
-    df_long = weekly_costs(df, group_col)
+def cost_over_time(rollup: pd.DataFrame, group_col: str, percent: bool):
+    df_long = rollup[["week_start", group_col, "cost"]]
     return _stacked_area(
         df_long,
         x_col="week_start",
@@ -64,9 +74,12 @@ def cost_over_time(df: pd.DataFrame, group_col: str, percent: bool):
     )
 
 
-def jobs_and_cost_bar(df: pd.DataFrame, group_col: str):
-    counts = df[group_col].value_counts()
-    total_cost = df.groupby(group_col)["default_cost"].sum().reindex(counts.index)
+def jobs_and_cost_bar(rollup: pd.DataFrame, group_col: str):
+    import plotly.graph_objects as go
+
+    totals = rollup.groupby(group_col, observed=True)[["count", "cost"]].sum()
+    counts = totals["count"].sort_values(ascending=False)
+    total_cost = totals["cost"].reindex(counts.index)
 
     x = counts.index.tolist()
     fig = go.Figure()
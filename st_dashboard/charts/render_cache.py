@@ -0,0 +1,100 @@
+import io
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+from config.settings import get_settings
+
+_NONE = b""
+
+
+def _encode_plotly(fig) -> bytes:
+    return fig.to_json().encode()
+
+
+def _decode_plotly(payload: bytes):
+    import plotly.io as pio
+
+    return pio.from_json(payload.decode(), skip_invalid=True)
+
+
+def _encode_matplotlib(fig) -> bytes:
+    import matplotlib.pyplot as plt
+
+    try:
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", bbox_inches="tight")
+        return buf.getvalue()
+    finally:
+        # The cache owns the figure: it is rasterized once and released
+        plt.close(fig)
+
+
+class RenderCache:
+    """Process-wide LRU of rendered charts, bounded by the total payload size.
+
+    Keys must capture everything a chart depends on: the data version plus the
+    chart's own inputs (task, top_n, percent, date range, ...). Plotly figures are
+    kept as JSON and Matplotlib figures as PNG bytes.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _get(self, key):
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+            return payload
+
+    def _put(self, key, payload: bytes):
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = payload
+            self._size += len(payload)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _get_or_build(self, key, build: Callable, encode: Callable) -> bytes:
+        payload = self._get(key)
+        if payload is None:
+            fig = build()
+            payload = _NONE if fig is None else encode(fig)
+            self._put(key, payload)
+        return payload
+
+    def plotly(self, key: Hashable, build: Callable):
+        """Plotly figure for ``key``, building it with ``build()`` on a miss (None passes through)."""
+        payload = self._get_or_build(("plotly", key), build, _encode_plotly)
+        return None if payload == _NONE else _decode_plotly(payload)
+
+    def matplotlib(self, key: Hashable, build: Callable) -> Optional[bytes]:
+        """PNG bytes for ``key``; the figure from ``build()`` is closed after rendering."""
+        payload = self._get_or_build(("matplotlib", key), build, _encode_matplotlib)
+        return None if payload == _NONE else payload
+
+
+_render_cache = None
+
+
+def get_render_cache() -> RenderCache:
+    global _render_cache
+    if _render_cache is None:
+        _render_cache = RenderCache(get_settings().render_cache_bytes)
+    return _render_cache
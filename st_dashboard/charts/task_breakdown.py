@@ -1,23 +1,34 @@
 import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import seaborn as sns
-import matplotlib.pyplot as plt
-from matplotlib.lines import Line2D
 
+from st_dashboard.data.cube import rollup
+from st_dashboard.data.distributions import box_stats, merge_hist
 from st_dashboard.data.transforms import build_family_palette
 
+# Plotly, Matplotlib and seaborn are imported inside the chart functions that use
+# them, so importing a page does not pay for every plotting stack up front.
+
 
 def _label_top_n(df_long, label_col, value_col, top_n):
-    totals = df_long.groupby(label_col)[value_col].sum().sort_values(ascending=False)
+    totals = df_long.groupby(label_col, observed=True)[value_col].sum().sort_values(ascending=False)
     top_titles = totals.head(top_n).index.tolist()
     df_long = df_long.copy()
-    df_long["label"] = df_long[label_col].where(df_long[label_col].isin(top_titles), "Other")
+    labels = df_long[label_col].astype(object)
+    df_long["label"] = labels.where(labels.isin(top_titles), "Other")
     return df_long, top_titles
 
 
+def _top_titles_frame(df_sub, top_titles):
+    df_plot = df_sub[df_sub["model_title_extracted"].isin(top_titles)].copy()
+    if isinstance(df_plot["model_title_extracted"].dtype, pd.CategoricalDtype):
+        # seaborn lays out every category, including ones filtered away
+        df_plot["model_title_extracted"] = df_plot["model_title_extracted"].cat.remove_unused_categories()
+    return df_plot
+
+
 def _stacked_area(df_long, x_col, y_col, label_col, percent, title, y_title):
+    import plotly.express as px
+
     totals = df_long.groupby(label_col)[y_col].sum().to_dict()
     palette_map = build_family_palette(df_long[label_col].unique(), totals=totals)
     if "Other" in df_long[label_col].unique():
@@ -42,12 +53,10 @@ def _stacked_area(df_long, x_col, y_col, label_col, percent, title, y_title):
     return fig
 
 
-def usage_over_time(df_sub, top_n=8, percent=False):
-    df_long = (
-        df_sub.groupby(["week_start", "model_title_extracted"])
-        .size()
-        .reset_index(name="count")
-    )
+def usage_over_time(cells, top_n=8, percent=False):
+    df_long = rollup(cells, ["week_start", "model_title_extracted"])[
+        ["week_start", "model_title_extracted", "count"]
+    ]
     df_long, _ = _label_top_n(df_long, "model_title_extracted", "count", top_n)
     df_long = df_long.groupby(["week_start", "label"])["count"].sum().reset_index()
     return _stacked_area(
@@ -61,12 +70,10 @@ def usage_over_time(df_sub, top_n=8, percent=False):
     )
 
 
-def cost_over_time(df_sub, top_n=8, percent=False):
-    df_long = (
-        df_sub.groupby(["week_start", "model_title_extracted"])["default_cost"]
-        .sum()
-        .reset_index(name="cost")
-    )
+def cost_over_time(cells, top_n=8, percent=False):
+    df_long = rollup(cells, ["week_start", "model_title_extracted"])[
+        ["week_start", "model_title_extracted", "cost"]
+    ]
     df_long, _ = _label_top_n(df_long, "model_title_extracted", "cost", top_n)
     df_long = df_long.groupby(["week_start", "label"])["cost"].sum().reset_index()
     return _stacked_area(
@@ -80,20 +87,39 @@ def cost_over_time(df_sub, top_n=8, percent=False):
     )
 
 
-def quality_boxplot(df_sub, top_titles):
-    df_plot = df_sub[df_sub["model_title_extracted"].isin(top_titles)].copy()
-    df_plot = df_plot.dropna(subset=["quality_score"])
-    if df_plot.empty:
+def _merged_quality(hist, top_titles):
+    hist = hist[hist["model_title_extracted"].isin(top_titles)]
+    if hist.empty:
         return None
+    merged = merge_hist(hist)
+    merged["model_title_extracted"] = merged["model_title_extracted"].astype(object)
+    return merged
+
+
+def _present_titles(merged, top_titles):
+    present = set(merged["model_title_extracted"])
+    return [t for t in top_titles if t in present]
+
+
+def quality_boxplot(hist, top_titles):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    merged = _merged_quality(hist, top_titles)
+    if merged is None:
+        return None
+
+    stats = []
+    for title in _present_titles(merged, top_titles):
+        part = merged[merged["model_title_extracted"] == title]
+        stats.append({**box_stats(part["score"].to_numpy(), part["count"].to_numpy()), "label": title})
 
     fig, ax = plt.subplots(figsize=(12, 8))
-    sns.boxplot(
-        data=df_plot,
-        x="model_title_extracted",
-        y="quality_score",
-        showfliers=False,
-        ax=ax,
-    )
+    boxes = ax.bxp(stats, showfliers=False, patch_artist=True, widths=0.8)
+    for patch, color in zip(boxes["boxes"], sns.color_palette(n_colors=len(stats))):
+        patch.set_facecolor(color)
+    for median in boxes["medians"]:
+        median.set_color("black")
     ax.set_title("Quality score by model")
     ax.set_xlabel("Model")
     ax.set_ylabel("Quality score")
@@ -102,17 +128,21 @@ def quality_boxplot(df_sub, top_titles):
     return fig
 
 
-def quality_kde(df_sub, top_titles):
-    df_plot = df_sub[df_sub["model_title_extracted"].isin(top_titles)].copy()
-    df_plot = df_plot.dropna(subset=["quality_score"])
-    if df_plot.empty:
+def quality_kde(hist, top_titles):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    merged = _merged_quality(hist, top_titles)
+    if merged is None:
         return None
 
     fig, ax = plt.subplots(figsize=(12, 8))
     sns.kdeplot(
-        data=df_plot,
-        x="quality_score",
+        data=merged,
+        x="score",
+        weights="count",
         hue="model_title_extracted",
+        hue_order=_present_titles(merged, top_titles),
         common_norm=False,
         fill=True,
         alpha=0.25,
@@ -125,17 +155,20 @@ def quality_kde(df_sub, top_titles):
     return fig
 
 
-def download_rate_bar(df_sub, top_titles):
-    df_plot = df_sub[df_sub["model_title_extracted"].isin(top_titles)].copy()
-    if df_plot.empty:
+def download_rate_bar(cells, top_titles):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    cells = _top_titles_frame(cells, top_titles)
+    if cells.empty:
         return None
     download_rate = (
-        df_plot.groupby("model_title_extracted")["was_downloaded"]
-        .mean()
+        rollup(cells, "model_title_extracted")
+        .set_index("model_title_extracted")["download_rate"]
         .sort_values(ascending=False)
     )
     fig, ax = plt.subplots(figsize=(12, 4.5))
-    sns.barplot(x=download_rate.index, y=download_rate.values, color="#4E79A7", ax=ax)
+    sns.barplot(x=download_rate.index.tolist(), y=download_rate.values, color="#4E79A7", ax=ax)
     ax.set_title("Download rate by model")
     ax.set_xlabel("Model")
     ax.set_ylabel("Download rate")
@@ -145,16 +178,15 @@ def download_rate_bar(df_sub, top_titles):
     return fig
 
 
-def avg_cost_bar(df_sub, top_titles):
-    df_plot = df_sub[df_sub["model_title_extracted"].isin(top_titles)].copy()
-    if df_plot.empty:
+def avg_cost_bar(cells, top_titles):
+    import plotly.graph_objects as go
+
+    cells = _top_titles_frame(cells, top_titles)
+    if cells.empty:
         return None
-    avg_cost = (
-        df_plot.groupby("model_title_extracted")["default_cost"]
-        .mean()
-        .sort_values(ascending=False)
-    )
-    totals = df_plot.groupby("model_title_extracted")["default_cost"].sum().to_dict()
+    by_title = rollup(cells, "model_title_extracted").set_index("model_title_extracted")
+    avg_cost = by_title["avg_cost"].sort_values(ascending=False)
+    totals = by_title["cost"].to_dict()
     palette_map = build_family_palette(avg_cost.index.tolist(), totals=totals)
     ordered_labels = avg_cost.index.tolist()
     colors = [palette_map.get(label, "#4E79A7") for label in ordered_labels]
@@ -178,17 +210,17 @@ def avg_cost_bar(df_sub, top_titles):
     return fig
 
 
-def weekly_avg_cost_line(df_sub, top_titles):
-    df_plot = df_sub[df_sub["model_title_extracted"].isin(top_titles)].copy()
-    if df_plot.empty:
+def weekly_avg_cost_line(cells, top_titles):
+    import plotly.express as px
+
+    cells = _top_titles_frame(cells, top_titles)
+    if cells.empty:
         return None
-    df_ts = (
-        df_plot.groupby(["week_start", "model_title_extracted"])["default_cost"]
-        .mean()
-        .reset_index(name="avg_cost")
-    )
-    totals = df_plot.groupby("model_title_extracted")["default_cost"].sum().to_dict()
-    palette_map = build_family_palette(df_plot["model_title_extracted"].unique(), totals=totals)
+    df_ts = rollup(cells, ["week_start", "model_title_extracted"])[
+        ["week_start", "model_title_extracted", "avg_cost"]
+    ]
+    totals = rollup(cells, "model_title_extracted").set_index("model_title_extracted")["cost"].to_dict()
+    palette_map = build_family_palette(cells["model_title_extracted"].unique(), totals=totals)
 
     fig = px.line(
         df_ts,
@@ -202,22 +234,16 @@ def weekly_avg_cost_line(df_sub, top_titles):
     return fig
 
 
-def scatter_quality_cost(df_sub, top_titles):
-    df_plot = df_sub[df_sub["model_title_extracted"].isin(top_titles)].copy()
-    summary = (
-        df_plot.groupby("model_title_extracted")
-        .agg(
-            n=("quality_score", "size"),
-            avg_score=("quality_score", "mean"),
-            avg_cost=("default_cost", "mean"),
-            download_rate=("was_downloaded", "mean"),
-        )
-        .reset_index()
-    )
+def scatter_quality_cost(cells, top_titles):
+    import matplotlib.pyplot as plt
+    from matplotlib.lines import Line2D
+
+    cells = _top_titles_frame(cells, top_titles)
+    summary = rollup(cells, "model_title_extracted").rename(columns={"count": "n"})
     if summary.empty:
         return None
 
-    totals = df_plot.groupby("model_title_extracted")["default_cost"].sum().to_dict()
+    totals = summary.set_index("model_title_extracted")["cost"].to_dict()
     palette_map = build_family_palette(summary["model_title_extracted"].unique(), totals=totals)
 
     fig, axes = plt.subplots(1, 2, figsize=(12, 4), sharey=True)
@@ -0,0 +1,174 @@
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, Optional
+
+import pandas as pd
+
+from st_dashboard.data.constants import AGG_MODEL_TYPES, MODEL_TYPE_RULES
+
+GROUP_KEYS = ("model_type", "model_type_agg")
+
+
+def _to_utc_datetime(value: date) -> datetime:
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    return datetime.combine(value, time.min, tzinfo=timezone.utc)
+
+
+def _contains(expr, token: str):
+    return {"$gte": [{"$indexOfCP": [expr, token]}, 0]}
+
+
+def _as_string(field: str):
+    # $indexOfCP and $toLower fail the whole aggregation on a non-string input; a number
+    # is matched on its text like classify_model_type does, anything else as ""
+    return {"$convert": {"input": field, "to": "string", "onError": "", "onNull": ""}}
+
+
+def model_type_expr():
+    """Server-side equivalent of ``transforms.classify_model_type``."""
+    model_id = {"$toLower": _as_string("$modelConfig.id")}
+    model_name = _as_string("$modelConfig.name")
+    branches = []
+    for model_type, id_token, name_token in MODEL_TYPE_RULES:
+        tests = [_contains(model_name, name_token)]
+        if id_token is not None:
+            tests.insert(0, _contains(model_id, id_token))
+        branches.append({"case": {"$or": tests}, "then": model_type})
+    return {"$switch": {"branches": branches, "default": "unknown"}}
+
+
+def model_type_agg_expr(model_type_field: str = "$model_type"):
+    return {
+        "$cond": [{"$in": [model_type_field, AGG_MODEL_TYPES]}, model_type_field, "other"]
+    }
+
+
+def date_range_match(start_date: Optional[date] = None, end_date: Optional[date] = None):
+    """``createdAt`` predicate matching the pages' inclusive day range (UTC)."""
+    created = {}
+    if start_date is not None:
+        created["$gte"] = _to_utc_datetime(start_date)
+    if end_date is not None:
+        created["$lt"] = _to_utc_datetime(end_date) + timedelta(days=1)
+    return {"createdAt": created} if created else {}
+
+
+# createdAt is a BSON date on almost every job, but older ones carry an ISO string;
+# every type is read through this one conversion and jobs where it fails are left out
+CREATED_FIELD = "created_at"
+_CREATED_EXPR = {
+    "$convert": {"input": "$createdAt", "to": "date", "onError": None, "onNull": None}
+}
+_CONVERTIBLE_TYPES = ["string", "number", "timestamp", "objectId"]
+
+
+def _created_stages(start_date: Optional[date] = None, end_date: Optional[date] = None):
+    """Normalize ``createdAt`` into ``created_at`` and keep the jobs inside the day range."""
+    created = {"$ne": None, **date_range_match(start_date, end_date).get("createdAt", {})}
+    stages = []
+    if len(created) > 1:
+        # Index-backed prefilter; values $convert can turn into dates pass it and are
+        # checked against the range after conversion
+        prefilter = date_range_match(start_date, end_date)
+        convertible = {"createdAt": {"$type": _CONVERTIBLE_TYPES}}
+        stages.append({"$match": {"$or": [prefilter, convertible]}})
+    stages += [
+        {"$addFields": {CREATED_FIELD: _CREATED_EXPR}},
+        {"$match": {CREATED_FIELD: created}},
+    ]
+    return stages
+
+
+def _classify_stages():
+    return [
+        {"$addFields": {"model_type": model_type_expr()}},
+        {"$addFields": {"model_type_agg": model_type_agg_expr()}},
+    ]
+
+
+def weekly_rollup_pipeline(
+    group_col: str = "model_type_agg",
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    model_types: Optional[Iterable[str]] = None,
+):
+    if group_col not in GROUP_KEYS:
+        raise ValueError(f"Unsupported group column for server-side rollup: {group_col}")
+
+    pipeline = _created_stages(start_date, end_date)
+    pipeline.extend(_classify_stages())
+    if model_types is not None:
+        pipeline.append({"$match": {group_col: {"$in": list(model_types)}}})
+    pipeline.extend(
+        [
+            {
+                "$group": {
+                    "_id": {
+                        # Monday-aligned, same as created.dt.to_period("W").dt.start_time
+                        "week_start": {
+                            "$dateTrunc": {
+                                "date": f"${CREATED_FIELD}",
+                                "unit": "week",
+                                "startOfWeek": "monday",
+                            }
+                        },
+                        "group": f"${group_col}",
+                    },
+                    "count": {"$sum": 1},
+                    "cost": {
+                        "$sum": {
+                            "$convert": {
+                                "input": "$modelConfig.costConfig.defaultCost",
+                                "to": "double",
+                                "onError": None,
+                                "onNull": None,
+                            }
+                        }
+                    },
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "week_start": "$_id.week_start",
+                    group_col: "$_id.group",
+                    "count": 1,
+                    "cost": 1,
+                }
+            },
+            {"$sort": {"week_start": 1, group_col: 1}},
+        ]
+    )
+    return pipeline
+
+
+def facets_pipeline(group_col: str = "model_type_agg"):
+    """Date bounds and available groups, enough to build the sidebar without raw rows."""
+    if group_col not in GROUP_KEYS:
+        raise ValueError(f"Unsupported group column for server-side rollup: {group_col}")
+    return _created_stages() + _classify_stages() + [
+        {
+            "$group": {
+                "_id": f"${group_col}",
+                "min_created": {"$min": f"${CREATED_FIELD}"},
+                "max_created": {"$max": f"${CREATED_FIELD}"},
+            }
+        },
+        {"$project": {"_id": 0, group_col: "$_id", "min_created": 1, "max_created": 1}},
+    ]
+
+
+def run_weekly_rollup(collection, group_col: str = "model_type_agg", max_time_ms: int = 10000, **filters):
+    pipeline = weekly_rollup_pipeline(group_col=group_col, **filters)
+    rows = list(collection.aggregate(pipeline, maxTimeMS=max_time_ms))
+    df = pd.DataFrame(rows, columns=["week_start", group_col, "count", "cost"])
+    df["week_start"] = pd.to_datetime(df["week_start"], utc=True).dt.tz_localize(None)
+    return df
+
+
+def run_facets(collection, group_col: str = "model_type_agg", max_time_ms: int = 10000):
+    rows = list(collection.aggregate(facets_pipeline(group_col), maxTimeMS=max_time_ms))
+    df = pd.DataFrame(rows, columns=[group_col, "min_created", "max_created"])
+    for col in ("min_created", "max_created"):
+        df[col] = pd.to_datetime(df[col], utc=True)
+    return df
@@ -2,6 +2,21 @@ MAIN_MODEL_TYPES = ["t2i", "i2i", "i2v", "v2v", "t2v", "t2s"]
 AGG_MODEL_TYPES = ["t2i", "i2i", "i2v", "v2v", "t2v"]
 DEFAULT_TOP_N = 8
 
+# Ordered (model_type, modelConfig.id substring, modelConfig.name substring) rules;
+# the first matching rule wins. The id is lower-cased before matching.
+MODEL_TYPE_RULES = [
+    ("t2i", "t2i", "Text to Image"),
+    ("i2i", "i2i", "Image to Image"),
+    ("i2v", "i2v", "Image to Video"),
+    ("v2v", "v2v", "Video to Video"),
+    ("t2v", "t2v", "Text to Video"),
+    ("t2s", "t2s", "Text to Speech"),
+    ("s2v", "s2v", "Speech to Video"),
+    ("minimatics", None, "Minimatics"),
+    ("character_models", None, "Character Models"),
+    ("sound_effects", None, "Sound Effects"),
+]
+
 # Family mapping for model title coloring
 FAMILY_RULES = [
     ("nanobanana", r"nano\s*banana|nanobanan|nano-banana"),
@@ -0,0 +1,85 @@
+from datetime import date
+from typing import Optional
+
+import pandas as pd
+
+
+# Day is kept in the key so the sidebar's day-level date range stays exact; charts
+# roll the cells up to weeks.
+CUBE_KEYS = ["dt", "week_start", "model_type", "model_type_agg", "model_title_extracted"]
+CUBE_MEASURES = [
+    "count",
+    "cost_sum",
+    "cost_count",
+    "downloaded",
+    "quality_count",
+    "quality_sum",
+    "quality_sumsq",
+]
+
+
+def build_cube(df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate the enriched frame into (day, week, task, title) cells.
+
+    Each cell holds additive statistics only, so any slice can be re-aggregated by
+    summing: means are ``*_sum / *_count`` and the quality variance follows from the
+    sum of squares.
+    """
+    if df.empty:
+        return pd.DataFrame(columns=CUBE_KEYS + CUBE_MEASURES)
+    quality = df["quality_score"].astype("float64")
+    cost = df["default_cost"].astype("float64")
+    work = pd.DataFrame(
+        {
+            **{key: df[key] for key in CUBE_KEYS},
+            "cost_sum": cost,
+            "cost_count": cost.notna(),
+            "downloaded": df["was_downloaded"],
+            "quality_count": quality.notna(),
+            "quality_sum": quality,
+            "quality_sumsq": quality ** 2,
+        }
+    )
+    # dropna=False: jobs without a title (or an unknown task) still count in every total
+    grouped = work.groupby(CUBE_KEYS, observed=True, sort=False, dropna=False)
+    cube = grouped.sum()
+    cube.insert(0, "count", grouped.size())
+    cube = cube.reset_index()
+    for col in ("cost_count", "downloaded", "quality_count"):
+        cube[col] = cube[col].astype("int64")
+    return cube
+
+
+def slice_cube(
+    cube: pd.DataFrame,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    **equals,
+) -> pd.DataFrame:
+    """Cells within an inclusive day range whose key columns equal the given values."""
+    mask = pd.Series(True, index=cube.index)
+    if start_date is not None:
+        mask &= cube["dt"] >= pd.Timestamp(start_date, tz="UTC")
+    if end_date is not None:
+        mask &= cube["dt"] < pd.Timestamp(end_date, tz="UTC") + pd.Timedelta(days=1)
+    for col, value in equals.items():
+        if isinstance(value, (list, tuple, set)):
+            mask &= cube[col].isin(list(value))
+        else:
+            mask &= cube[col] == value
+    return cube[mask]
+
+
+def rollup(cube_slice: pd.DataFrame, by) -> pd.DataFrame:
+    """Sum cells over ``by`` and derive the mean/rate columns the charts use."""
+    out = cube_slice.groupby(by, observed=True)[CUBE_MEASURES].sum().reset_index()
+    out["cost"] = out["cost_sum"]
+    out["avg_cost"] = out["cost_sum"] / out["cost_count"].where(out["cost_count"] > 0)
+    out["download_rate"] = out["downloaded"] / out["count"]
+    out["avg_score"] = out["quality_sum"] / out["quality_count"].where(out["quality_count"] > 0)
+    return out
+
+
+def top_titles(cube_slice: pd.DataFrame, top_n: int) -> list:
+    counts = cube_slice.groupby("model_title_extracted", observed=True)["count"].sum()
+    return counts[counts > 0].sort_values(ascending=False).head(top_n).index.tolist()
@@ -0,0 +1,158 @@
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from st_dashboard.data.transforms import union_categories
+
+DATETIME_FIELDS = {"createdAt", "updatedAt", "resultDownloadedAt"}
+NUMERIC_FIELDS = {
+    "modelConfig.costConfig.defaultCost",
+    "qualityAnalysis.score",
+    "qualityAnalysis.transformedScore",
+}
+CATEGORICAL_FIELDS = {
+    "status",
+    "modelConfig.provider",
+    "modelConfig.modelType",
+    "modelConfig.outputType",
+    "qualityAnalysis.qualityCheckStatus",
+    "error.code",
+}
+
+
+class MemoryCeilingExceeded(RuntimeError):
+    pass
+
+
+class ByteBudget:
+    """A decoded-bytes ceiling shared by every cursor of one read (e.g. all shards).
+
+    Once the ceiling is crossed every further charge fails, so the other cursors stop
+    at their next batch instead of decoding their whole range first.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.used = 0
+        self.exceeded = False
+        self._lock = threading.Lock()
+
+    def charge(self, nbytes: int):
+        with self._lock:
+            self.used += nbytes
+            if self.used > self.max_bytes:
+                self.exceeded = True
+            if self.exceeded:
+                raise MemoryCeilingExceeded(
+                    f"Decoded data exceeded the {self.max_bytes} byte ceiling"
+                )
+
+    def release(self, nbytes: int):
+        # Bytes of an attempt that is thrown away (e.g. a shard that will be retried)
+        with self._lock:
+            self.used -= nbytes
+
+
+def projected_fields(projection: Dict[str, int]) -> List[str]:
+    return [field for field, include in projection.items() if include]
+
+
+def _lookup(doc, path: List[str]):
+    value = doc
+    for part in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+        if value is None:
+            return None
+    return value
+
+
+def _typed_column(field: str, values: list) -> pd.Series:
+    if field in DATETIME_FIELDS:
+        return pd.Series(pd.to_datetime(values, errors="coerce", utc=True).tz_localize(None))
+    if field in NUMERIC_FIELDS:
+        return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+    if field in CATEGORICAL_FIELDS:
+        return pd.Series(values, dtype="category")
+    return pd.Series(values, dtype=object)
+
+
+def _batch_frame(fields: List[str], buffers: Dict[str, list]) -> pd.DataFrame:
+    return pd.DataFrame({field: _typed_column(field, buffers[field]) for field in fields})
+
+
+def _concat(batches: List[pd.DataFrame], fields: List[str]) -> pd.DataFrame:
+    if len(batches) == 1:
+        return batches[0]
+    columns = {}
+    for field in fields:
+        parts = [batch[field] for batch in batches]
+        if field in CATEGORICAL_FIELDS:
+            categories = union_categories(parts)
+            if categories is not None:
+                parts = [part.cat.set_categories(categories) for part in parts]
+        columns[field] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(columns)
+
+
+def concat_decoded(frames: List[pd.DataFrame], projection: Dict[str, int]) -> pd.DataFrame:
+    """Concatenate frames decoded independently (e.g. per shard) with the same projection."""
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+    return _concat(frames, projected_fields(projection))
+
+
+def decode_cursor(
+    cursor: Iterable[dict],
+    projection: Dict[str, int],
+    batch_size: int = 5000,
+    max_bytes: Optional[int] = None,
+    budget: Optional[ByteBudget] = None,
+) -> pd.DataFrame:
+    """Decode Mongo documents into a typed frame, ``batch_size`` documents at a time.
+
+    Only the projected (dotted) fields are extracted. Each batch is converted to
+    typed columns before the next one is read, so raw dicts never pile up for the
+    whole result. ``max_bytes`` bounds the size of the decoded batches; pass a shared
+    ``budget`` instead to bound several cursors decoded concurrently.
+    """
+    if budget is None and max_bytes is not None:
+        budget = ByteBudget(max_bytes)
+    fields = projected_fields(projection)
+    paths = {field: field.split(".") for field in fields}
+    batches: List[pd.DataFrame] = []
+    charged = 0
+    buffers = {field: [] for field in fields}
+    pending = 0
+
+    def flush():
+        nonlocal charged, buffers, pending
+        batch = _batch_frame(fields, buffers)
+        if budget is not None:
+            nbytes = int(batch.memory_usage(deep=True).sum())
+            charged += nbytes
+            budget.charge(nbytes)
+        batches.append(batch)
+        buffers = {field: [] for field in fields}
+        pending = 0
+
+    try:
+        for doc in cursor:
+            for field in fields:
+                buffers[field].append(_lookup(doc, paths[field]))
+            pending += 1
+            if pending >= batch_size:
+                flush()
+        if pending:
+            flush()
+    except Exception:
+        if budget is not None:
+            budget.release(charged)
+        raise
+
+    if not batches:
+        return pd.DataFrame()
+    return _concat(batches, fields)
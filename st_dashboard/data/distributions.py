@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+# Scores are bounded and reported with at most two decimals, so bins of this width
+# are effectively exact and any set of them merges by summing counts.
+QUALITY_BIN_WIDTH = 0.01
+HIST_KEYS = ["dt", "week_start", "model_type", "model_title_extracted"]
+
+
+def build_quality_hist(df: pd.DataFrame) -> pd.DataFrame:
+    """Sparse quality-score histogram per (day, week, task, title): one row per non-empty bin."""
+    columns = HIST_KEYS + ["bin", "count"]
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+    scores = df["quality_score"].astype("float64")
+    valid = scores.notna().to_numpy()
+    if not valid.any():
+        return pd.DataFrame(columns=columns)
+    work = df.loc[valid, HIST_KEYS].assign(
+        bin=np.rint(scores[valid] / QUALITY_BIN_WIDTH).astype("int64")
+    )
+    return (
+        work.groupby(HIST_KEYS + ["bin"], observed=True, sort=False)
+        .size()
+        .reset_index(name="count")
+    )
+
+
+def merge_hist(hist_slice: pd.DataFrame, by: str = "model_title_extracted") -> pd.DataFrame:
+    """Sum a slice of histograms into one histogram per ``by`` value, sorted by score."""
+    merged = (
+        hist_slice.groupby([by, "bin"], observed=True)["count"]
+        .sum()
+        .reset_index()
+        .sort_values([by, "bin"], ignore_index=True)
+    )
+    merged["score"] = merged["bin"] * QUALITY_BIN_WIDTH
+    return merged
+
+
+def weighted_quantiles(values: np.ndarray, counts: np.ndarray, qs) -> np.ndarray:
+    """``np.quantile`` (linear interpolation) of the sample where ``values[i]`` occurs ``counts[i]`` times."""
+    cum = np.cumsum(counts)
+    pos = np.asarray(qs, dtype="float64") * (cum[-1] - 1)
+    lo = np.floor(pos).astype("int64")
+    hi = np.ceil(pos).astype("int64")
+    v_lo = values[np.searchsorted(cum, lo, side="right")]
+    v_hi = values[np.searchsorted(cum, hi, side="right")]
+    return v_lo + (v_hi - v_lo) * (pos - lo)
+
+
+def box_stats(values: np.ndarray, counts: np.ndarray, whis: float = 1.5) -> dict:
+    """Matplotlib ``bxp`` statistics, computed the way ``boxplot`` does from raw data."""
+    q1, med, q3 = weighted_quantiles(values, counts, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - whis * iqr) & (values <= q3 + whis * iqr)]
+    return {
+        "q1": q1,
+        "med": med,
+        "q3": q3,
+        "whislo": inside.min() if len(inside) else q1,
+        "whishi": inside.max() if len(inside) else q3,
+        "mean": float(np.average(values, weights=counts)),
+        "fliers": [],
+    }
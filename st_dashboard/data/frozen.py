@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+# Buffers behind pandas' extension arrays (datetimes, categoricals, nullable ints/bools)
+_BUFFER_ATTRS = ("_ndarray", "_codes", "_data", "_mask")
+
+
+def _buffers(array):
+    if isinstance(array, np.ndarray):
+        yield array
+        return
+    for attr in _BUFFER_ATTRS:
+        buffer = getattr(array, attr, None)
+        if isinstance(buffer, np.ndarray):
+            yield buffer
+
+
+def freeze_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Mark every column buffer of ``df`` read-only, in place, and return it.
+
+    Frames owned by an ``st.cache_resource`` object are shared by every session
+    without copying; freezing them turns an accidental in-place write (``df.loc[...] =``,
+    ``fillna(inplace=True)``) into an error instead of a change other sessions see.
+    Derived frames (filters, ``assign``, slices that pandas copies) stay writable.
+    """
+    for array in df._mgr.arrays:
+        for buffer in _buffers(array):
+            buffer.flags.writeable = False
+    return df
+
+
+def is_frozen(df: pd.DataFrame) -> bool:
+    return all(
+        not buffer.flags.writeable for array in df._mgr.arrays for buffer in _buffers(array)
+    )
@@ -0,0 +1,161 @@
+import threading
+
+import pandas as pd
+
+from st_dashboard.data.sharded import fetch_sharded
+from st_dashboard.data.time_index import sort_by_created
+from st_dashboard.instrumentation import span
+from st_dashboard.data.frozen import freeze_frame
+from st_dashboard.data.parallel import enrich_frame
+from st_dashboard.data.transforms import align_categories
+
+WATERMARK_FIELD = "updatedAt"
+
+
+def _key_column(df: pd.DataFrame):
+    for col in ("_id", "jobId"):
+        if col in df.columns:
+            return col
+    return None
+
+
+def upsert_frame(base: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """Replace rows of ``base`` that reappear in ``delta`` (by _id/jobId) and append new ones."""
+    if base.empty:
+        return delta.reset_index(drop=True)
+    if delta.empty:
+        return base
+    key = _key_column(delta)
+    if key is None or key not in base.columns:
+        return pd.concat(align_categories([base, delta]), ignore_index=True)
+    delta = delta.drop_duplicates(subset=key, keep="last")
+    kept = base[~base[key].isin(delta[key])]
+    return pd.concat(align_categories([kept, delta]), ignore_index=True)
+
+
+class IncrementalLoader:
+    """Keeps the enriched frame in memory and only reads documents updated past a watermark.
+
+    Jobs change after creation (status, resultDownloadedAt, qualityAnalysis), so the
+    tail is selected on ``updatedAt`` and upserted by ``_id`` / ``jobId``. The
+    watermark comparison is inclusive because several documents can share the same
+    millisecond; re-reading them is harmless since the merge is an upsert.
+    """
+
+    def __init__(
+        self,
+        collection,
+        projection,
+        query=None,
+        max_time_ms=10000,
+        snapshot=None,
+        batch_size=5000,
+        max_bytes=None,
+        shards=1,
+        retries=2,
+        enrich_workers=1,
+        enrich_min_rows=200_000,
+    ):
+        self.collection = collection
+        self.projection = projection
+        self.query = dict(query or {})
+        self.max_time_ms = max_time_ms
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.shards = shards
+        self.retries = retries
+        self.enrich_workers = enrich_workers
+        self.enrich_min_rows = enrich_min_rows
+        self.snapshot = snapshot
+        self.frame = pd.DataFrame()
+        self.watermark = None
+        self.version = 0
+        # (frame, version) swapped as one tuple, so readers that skip the lock never
+        # pair a frame with another frame's version
+        self.published = (self.frame, self.version)
+        # Serializes writers (refreshes, range loads, live batches); readers never take it
+        self._lock = threading.Lock()
+        self._restored = snapshot is None
+
+    def _restore(self):
+        self._restored = True
+        frame, watermark = self.snapshot.load()
+        if frame is not None:
+            self.watermark = watermark
+            self._publish(freeze_frame(frame))
+
+    def _save_snapshot(self, weeks):
+        self.snapshot.save(self.frame, self.watermark, weeks=weeks)
+
+    def _publish(self, frame: pd.DataFrame):
+        self.frame = frame
+        self.version += 1
+        self.published = (frame, self.version)
+
+    def _tail_query(self):
+        if self.watermark is None:
+            return dict(self.query)
+        tail = {WATERMARK_FIELD: {"$gte": self.watermark}}
+        if not self.query:
+            return tail
+        return {"$and": [self.query, tail]}
+
+    def fetch(self, query, shards=None) -> pd.DataFrame:
+        with span("mongo.find+decode") as s:
+            df = fetch_sharded(
+                self.collection,
+                query,
+                self.projection,
+                shards=self.shards if shards is None else shards,
+                max_time_ms=self.max_time_ms,
+                retries=self.retries,
+                batch_size=self.batch_size,
+                max_bytes=self.max_bytes,
+            )
+            s.rows = len(df)
+        return df
+
+    def fetch_delta(self) -> pd.DataFrame:
+        # Watermark tails are small; only the first full read is worth sharding
+        return self.fetch(self._tail_query(), shards=None if self.watermark is None else 1)
+
+    def _advance_watermark(self, delta: pd.DataFrame):
+        if WATERMARK_FIELD not in delta.columns:
+            return
+        latest = pd.to_datetime(delta[WATERMARK_FIELD], errors="coerce", utc=True).max()
+        if pd.isna(latest):
+            return
+        latest = latest.to_pydatetime()
+        if self.watermark is None or latest > self.watermark:
+            self.watermark = latest
+
+    def enrich(self, raw: pd.DataFrame) -> pd.DataFrame:
+        return enrich_frame(raw, workers=self.enrich_workers, min_rows=self.enrich_min_rows)
+
+    def apply(self, raw: pd.DataFrame, advance_watermark: bool = True) -> pd.DataFrame:
+        if raw.empty:
+            return self.frame
+        if "_id" in raw.columns:
+            # ObjectId has no columnar representation; keep a string key everywhere
+            raw = raw.assign(_id=raw["_id"].astype(str))
+        first_load = self.frame.empty
+        delta = self.enrich(raw)
+        if delta.empty and not first_load:
+            # Nothing this loader keeps changed (e.g. only other tasks' jobs): the frame
+            # and its version stay as they are
+            if advance_watermark:
+                self._advance_watermark(raw)
+            return self.frame
+        # Every session reads this frame directly, so it is swapped, never modified
+        self._publish(freeze_frame(sort_by_created(upsert_frame(self.frame, delta))))
+        if advance_watermark or self.watermark is None:
+            self._advance_watermark(raw)
+        if self.snapshot is not None:
+            self._save_snapshot(None if first_load else delta["isoweek"].unique())
+        return self.frame
+
+    def refresh(self) -> pd.DataFrame:
+        with self._lock:
+            if not self._restored:
+                self._restore()
+            return self.apply(self.fetch_delta())
@@ -0,0 +1,69 @@
+import json
+import struct
+from typing import List, Sequence
+
+import pandas as pd
+import pyarrow as pa
+
+# Schema metadata key listing columns shipped as JSON text (nested Mongo values)
+JSON_COLUMNS_KEY = b"json_columns"
+# Length prefix of each frame in a multi-frame payload (unsigned 64-bit, little endian)
+_FRAME_LENGTH = struct.Struct("<Q")
+
+
+def _arrowable(values: pd.Series) -> bool:
+    try:
+        pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        return False
+    return True
+
+
+def to_ipc(df: pd.DataFrame) -> bytes:
+    """Serialize ``df`` as an Arrow IPC stream; ``from_ipc`` restores dtypes and nested values."""
+    # e.g. modelConfig.inputs mixes dicts and lists; such columns travel as JSON text
+    json_columns = [
+        col for col in df.columns if df[col].dtype == object and not _arrowable(df[col])
+    ]
+    if json_columns:
+        df = df.assign(
+            **{
+                col: df[col].map(lambda v: json.dumps(v, default=str), na_action="ignore")
+                for col in json_columns
+            }
+        )
+    # from_pandas keeps the pandas metadata, so nullable ints and categoricals round-trip
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {**table.schema.metadata, JSON_COLUMNS_KEY: json.dumps(json_columns).encode()}
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def from_ipc(payload: bytes) -> pd.DataFrame:
+    table = pa.ipc.open_stream(payload).read_all()
+    metadata = table.schema.metadata or {}
+    df = table.to_pandas()
+    for col in json.loads(metadata.get(JSON_COLUMNS_KEY, b"[]")):
+        df[col] = df[col].map(json.loads, na_action="ignore")
+    return df
+
+
+def to_ipc_frames(frames: Sequence[pd.DataFrame]) -> bytes:
+    """Several frames in one payload: each ``to_ipc`` stream prefixed with its length."""
+    parts = [to_ipc(df) for df in frames]
+    return b"".join(_FRAME_LENGTH.pack(len(part)) + part for part in parts)
+
+
+def from_ipc_frames(payload: bytes) -> List[pd.DataFrame]:
+    frames = []
+    offset = 0
+    while offset < len(payload):
+        (length,) = _FRAME_LENGTH.unpack_from(payload, offset)
+        offset += _FRAME_LENGTH.size
+        frames.append(from_ipc(payload[offset:offset + length]))
+        offset += length
+    return frames
@@ -0,0 +1,190 @@
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from st_dashboard.data.decode import decode_cursor
+
+logger = logging.getLogger(__name__)
+
+CHANGE_OPERATIONS = ["insert", "update", "replace"]
+# Raised by the server when the resume token has fallen off the oplog
+CHANGE_STREAM_HISTORY_LOST = 286
+
+
+def _rebase(expr, prefix: str):
+    """Rewrite field paths in an aggregation expression to live under ``prefix``."""
+    if isinstance(expr, str) and expr.startswith("$") and not expr.startswith("$$"):
+        return f"${prefix}.{expr[1:]}"
+    if isinstance(expr, dict):
+        return {key: _rebase(value, prefix) for key, value in expr.items()}
+    if isinstance(expr, list):
+        return [_rebase(value, prefix) for value in expr]
+    return expr
+
+
+def change_stream_pipeline(projection) -> list:
+    """Change events for inserts/updates, with ``fullDocument`` trimmed like a ``find``.
+
+    The event ``_id`` is the resume token and must be left untouched.
+    """
+    return [
+        {"$match": {"operationType": {"$in": CHANGE_OPERATIONS}}},
+        {
+            "$project": {
+                "_id": 1,
+                "operationType": 1,
+                **{
+                    f"fullDocument.{field}": _rebase(value, "fullDocument")
+                    for field, value in projection.items()
+                },
+            }
+        },
+    ]
+
+
+def watch_collection(collection, projection, max_await_time_ms=1000) -> Callable:
+    """Event source factory for ``ChangeStreamIngestor`` backed by ``collection.watch``."""
+
+    def open_stream(resume_after=None):
+        return collection.watch(
+            change_stream_pipeline(projection),
+            full_document="updateLookup",
+            resume_after=resume_after,
+            max_await_time_ms=max_await_time_ms,
+        )
+
+    return open_stream
+
+
+def _next_event(stream):
+    # pymongo's ChangeStream returns None from try_next() when nothing is pending;
+    # plain iterators (e.g. a list of fake events) end with StopIteration instead.
+    if hasattr(stream, "try_next"):
+        return stream.try_next()
+    return next(stream, None)
+
+
+class ChangeStreamIngestor:
+    """Applies change-stream events to every attached task ``RangeLoader`` in micro-batches.
+
+    ``open_stream(resume_after)`` returns the event source: anything with
+    ``try_next()`` (a pymongo ``ChangeStream``) or a plain iterator of events, which
+    keeps the ingestor testable without a replica set. Loaders are registered with
+    ``attach()``. Each batch is decoded once and offered to every loader, which keeps
+    only its task's jobs inside the ranges it has loaded; a loader the batch does not
+    touch is left as is, and the others rebuild their frame once per batch rather
+    than once per event.
+
+    The resume token is only kept in memory, to reopen a failed stream without a gap.
+    After a restart the stream starts from the present, and a loader restored from a
+    snapshot catches up from its own watermark (``refresh()``) on the ingestor thread
+    once attached; the stream is already open by then, so nothing falls in between.
+    """
+
+    def __init__(self, open_stream: Callable, projection, batch_size=5000, batch_seconds=2.0):
+        self.open_stream = open_stream
+        self.projection = projection
+        self.batch_size = batch_size
+        self.batch_seconds = batch_seconds
+        self.loaders = []
+        self.resume_token = None
+        self.applied = 0
+        self._stream = None
+        self._pending = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def attach(self, loader):
+        """Start applying events to ``loader``; returns it."""
+        with self._lock:
+            if loader not in self.loaders:
+                self.loaders.append(loader)
+                if loader.snapshot is not None:
+                    self._pending.append(loader)
+        return loader
+
+    def _attached(self) -> list:
+        with self._lock:
+            return list(self.loaders)
+
+    def _catch_up(self, loaders):
+        for loader in loaders:
+            loader.refresh()
+
+    def _catch_up_pending(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        self._catch_up(pending)
+
+    def _open(self):
+        from pymongo.errors import OperationFailure
+
+        try:
+            return self.open_stream(resume_after=self.resume_token)
+        except OperationFailure as exc:
+            if exc.code != CHANGE_STREAM_HISTORY_LOST or self.resume_token is None:
+                raise
+            logger.warning("Resume token is no longer in the oplog; catching up from the watermark")
+            self.resume_token = None
+            stream = self.open_stream(resume_after=None)
+            self._catch_up(self._attached())
+            return stream
+
+    def _read_batch(self) -> list:
+        events = []
+        deadline = time.monotonic() + self.batch_seconds
+        while len(events) < self.batch_size and time.monotonic() < deadline:
+            event = _next_event(self._stream)
+            if event is None:
+                if not hasattr(self._stream, "try_next"):
+                    break
+                continue
+            events.append(event)
+        return events
+
+    def apply_events(self, events: list) -> int:
+        """Upsert the events' documents and advance the resume token; returns rows applied."""
+        if not events:
+            return 0
+        docs = [e["fullDocument"] for e in events if e.get("fullDocument") is not None]
+        if docs:
+            raw = decode_cursor(docs, self.projection, batch_size=len(docs))
+            for loader in self._attached():
+                loader.apply_changes(raw)
+        self.resume_token = events[-1]["_id"]
+        self.applied += len(docs)
+        return len(docs)
+
+    def run_once(self) -> int:
+        """Read and apply one micro-batch; returns the number of events consumed."""
+        if self._stream is None:
+            self._stream = self._open()
+        self._catch_up_pending()
+        events = self._read_batch()
+        self.apply_events(events)
+        return len(events)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if not self.run_once() and not hasattr(self._stream, "try_next"):
+                    # A finite source is drained; nothing more will arrive
+                    break
+            except Exception as exc:
+                logger.warning("Change stream ingestion failed, reopening: %s", exc)
+                self._stream = None
+                self._stop.wait(self.batch_seconds)
+
+    def start(self) -> "ChangeStreamIngestor":
+        if self._thread is None:
+            # Subscribe before any catch-up read so nothing written in between is lost;
+            # events overlapping the read are upserted again, which is harmless.
+            self._stream = self._open()
+            self._thread = threading.Thread(target=self._run, name="change-stream", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
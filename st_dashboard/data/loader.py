@@ -1,57 +1,214 @@
-import pandas as pd
+from pathlib import Path
+
 import streamlit as st
 
+from config.settings import get_settings
 from src.mongo.mongo_db_client import get_collection
-from st_dashboard.data.transforms import enrich_dataframe
+from st_dashboard.data.aggregates import run_facets, run_weekly_rollup
+from st_dashboard.data.cube import slice_cube
+from st_dashboard.data.frozen import freeze_frame
+from st_dashboard.data.live import ChangeStreamIngestor, watch_collection
+from st_dashboard.data.projections import BASE_PROJECTION, fetch_job_details
+from st_dashboard.data.pushdown import RangeLoader, task_predicate
+from st_dashboard.data.refresher import BackgroundRefresher, StaleCache
+from st_dashboard.data.service import AggregateClient, TaskDerived, recent_jobs_frame
+from st_dashboard.instrumentation import log_spans, span
 
 DB_NAME = "renderboard"
 COLLECTION_NAME = "assetGenJobs"
 
-BASE_PROJECTION = {
-    "_id": 1,
-    "jobId": 1,
-    "userId": 1,
-    "createdAt": 1,
-    "updatedAt": 1,
-    "status": 1,
-    "modelConfig.id": 1,
-    "modelConfig.name": 1,
-    "modelConfig.modelTitle": 1,
-    "modelConfig.modelType": 1,
-    "modelConfig.outputType": 1,
-    "modelConfig.provider": 1,
-    "modelConfig.inputs": 1,
-    "modelConfig.costConfig.defaultCost": 1,
-    "modelConfig.costConfig.rules": 1,
-    "modelConfig.modelMetaData.openAIModelId": 1,
-    "qualityAnalysis.score": 1,
-    "qualityAnalysis.rewrittenPrompt": 1,
-    "qualityAnalysis.reasoning": 1,
-    "qualityAnalysis.transformedScore": 1,
-    "qualityAnalysis.qualityCheckStatus": 1,
-    "resultDownloadedAt": 1,
-    "error.code": 1,
-    "error.message": 1,
-}
+
+@st.cache_resource
+def _configure_span_log():
+    # Read with the first data access rather than at import, so importing a page
+    # does not require (or validate) the MongoDB settings
+    if get_settings().log_spans:
+        log_spans()
 
 
 @st.cache_resource
 def get_collection_cached():
+    _configure_span_log()
     return get_collection(DB_NAME, COLLECTION_NAME)
 
 
-@st.cache_data(ttl=900)
-def load_raw_data(query=None):
+@st.cache_resource
+def get_aggregate_client():
+    _configure_span_log()
+    # Client mode: an aggregate server owns the data and this worker never reads Mongo
+    settings = get_settings()
+    if not settings.aggregate_server_url:
+        return None
+    return AggregateClient(settings.aggregate_server_url, timeout=settings.aggregate_timeout_seconds)
+
+
+def _fetch_options() -> dict:
+    settings = get_settings()
+    return {
+        "shards": settings.fetch_shards,
+        "max_time_ms": settings.fetch_shard_timeout_ms,
+        "retries": settings.fetch_shard_retries,
+        "batch_size": settings.fetch_batch_size,
+        "max_bytes": settings.fetch_max_bytes,
+    }
+
+
+def _loader_options() -> dict:
+    settings = get_settings()
+    return {
+        **_fetch_options(),
+        "enrich_workers": settings.enrich_workers,
+        "enrich_min_rows": settings.enrich_min_rows,
+    }
+
+
+@st.cache_resource
+def get_live_ingestor():
+    # One change stream per process; task loaders attach to it as they are created
+    if not get_settings().live_ingest or get_aggregate_client() is not None:
+        return None
     collection = get_collection_cached()
-    query = query or {}
-    cursor = collection.find(query, BASE_PROJECTION, max_time_ms=10000)
-    df = pd.json_normalize(cursor)
-    return df
+    return ChangeStreamIngestor(watch_collection(collection, BASE_PROJECTION), BASE_PROJECTION).start()
+
+
+def _task_snapshot(model_type):
+    # One directory per task predicate, so a changed predicate starts a new snapshot
+    snapshot_dir = get_settings().snapshot_dir
+    if not snapshot_dir:
+        return None
+    # Parquet support is only imported when snapshots are enabled
+    from st_dashboard.data.snapshot import SnapshotStore, query_key
+
+    return SnapshotStore(Path(snapshot_dir) / "tasks" / query_key(task_predicate(model_type)))
+
+
+@st.cache_resource
+def get_range_loader(model_type):
+    loader = RangeLoader(
+        get_collection_cached(),
+        BASE_PROJECTION,
+        model_type,
+        snapshot=_task_snapshot(model_type),
+        **_loader_options(),
+    )
+    ingestor = get_live_ingestor()
+    if ingestor is not None:
+        ingestor.attach(loader)
+    return loader
+
+
+@st.cache_resource
+def get_task_refresher(model_type):
+    # Keeps the task's covered ranges fresh off the request path, which never
+    # refreshes; with LIVE_INGEST the change stream does
+    if get_aggregate_client() is not None or get_live_ingestor() is not None:
+        return None
+    loader = get_range_loader(model_type)
+    return BackgroundRefresher(
+        loader.refresh, get_settings().refresh_interval_seconds, name=f"task:{model_type}"
+    ).start()
+
+
+def load_task_data(model_type, start_date, end_date):
+    """Jobs of one task with [start_date, end_date] guaranteed loaded.
+
+    Returns the task's whole cached frame (it may cover more than the requested
+    range) and its version, which changes whenever the frame does.
+    """
+    with span("loader.load_task_data", model_type=model_type) as s:
+        frame, version = get_range_loader(model_type).ensure(start_date, end_date)
+        s.rows = len(frame)
+    # Started once the first range is covered, so its start-up refresh has work to do
+    get_task_refresher(model_type)
+    return frame, version
+
+
+@st.cache_resource
+def _task_derived():
+    return TaskDerived()
+
+
+def load_task_index(model_type, frame, version):
+    # Shared, not copied: callers get read-only positional slices of the task frame
+    return _task_derived().get("index", model_type, frame, version)
+
+
+def load_task_cube(model_type, frame, version):
+    # Rebuilt per loader version: date changes inside covered ranges reuse the cube
+    return _task_derived().get("cube", model_type, frame, version)
+
+
+def load_task_quality_hist(model_type, frame, version):
+    return _task_derived().get("quality_hist", model_type, frame, version)
+
+
+def load_task_slices(model_type, start_date, end_date):
+    """(version, cube cells, quality histogram) of one task within [start_date, end_date]."""
+    client = get_aggregate_client()
+    if client is not None:
+        return client.task_slices(model_type, start_date, end_date)
+    frame, version = load_task_data(model_type, start_date, end_date)
+    with span("loader.load_task_aggregates", model_type=model_type):
+        cube = load_task_cube(model_type, frame, version)
+        hist = load_task_quality_hist(model_type, frame, version)
+    return version, slice_cube(cube, start_date, end_date), slice_cube(hist, start_date, end_date)
+
+
+def load_recent_jobs(model_type, start_date, end_date, title, limit=20):
+    client = get_aggregate_client()
+    if client is not None:
+        return client.recent_jobs(model_type, start_date, end_date, title, limit)
+    frame, version = load_task_data(model_type, start_date, end_date)
+    index = load_task_index(model_type, frame, version)
+    return recent_jobs_frame(index, start_date, end_date, title, limit)
+
+
+def _weekly_rollup(group_col, start_date, end_date, model_types):
+    client = get_aggregate_client()
+    if client is not None:
+        return freeze_frame(client.weekly_rollup(group_col, start_date, end_date, model_types))
+    return freeze_frame(
+        run_weekly_rollup(
+            get_collection_cached(),
+            group_col=group_col,
+            start_date=start_date,
+            end_date=end_date,
+            model_types=model_types,
+        )
+    )
+
+
+def _facets(group_col):
+    client = get_aggregate_client()
+    if client is not None:
+        return freeze_frame(client.facets(group_col))
+    return freeze_frame(run_facets(get_collection_cached(), group_col=group_col))
+
+
+# Expired rollups and facets are served while a background thread rebuilds them, so
+# only the first visitor after a restart waits on the aggregation
+@st.cache_resource
+def _rollup_cache():
+    return StaleCache(_weekly_rollup, ttl_seconds=900, name="weekly-rollup")
+
+
+@st.cache_resource
+def _facets_cache():
+    return StaleCache(_facets, ttl_seconds=900, name="facets")
+
+
+def load_weekly_rollup(group_col="model_type_agg", start_date=None, end_date=None, model_types=None):
+    model_types = tuple(model_types) if model_types is not None else None
+    return _rollup_cache().get(group_col, start_date, end_date, model_types)
+
+
+def load_facets(group_col="model_type_agg"):
+    return _facets_cache().get(group_col)
 
 
 @st.cache_data(ttl=900)
-def load_data(query=None):
-    df = load_raw_data(query=query)
-    if df.empty:
-        return df
-    return enrich_dataframe(df)
+def load_job_details(job_ids):
+    client = get_aggregate_client()
+    if client is not None:
+        return client.job_details(job_ids)
+    return fetch_job_details(get_collection_cached(), job_ids)
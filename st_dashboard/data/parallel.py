@@ -0,0 +1,56 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import pandas as pd
+
+from st_dashboard.data.ipc import from_ipc, to_ipc
+from st_dashboard.data.transforms import align_categories, enrich_dataframe
+from st_dashboard.instrumentation import span
+
+_pool = None
+_pool_workers = 0
+
+
+def _enrich_chunk(payload: bytes) -> bytes:
+    return to_ipc(enrich_dataframe(from_ipc(payload)))
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        # Streamlit and pymongo run threads in this process, so never fork it
+        _pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        _pool_workers = workers
+    return _pool
+
+
+def _chunks(df: pd.DataFrame, parts: int) -> List[pd.DataFrame]:
+    size = -(-len(df) // parts)
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+
+def enrich_parallel(raw: pd.DataFrame, workers: int) -> pd.DataFrame:
+    """``enrich_dataframe`` over ``workers`` row chunks in a process pool.
+
+    Chunks travel as Arrow IPC buffers rather than pickled frames, and each worker
+    also compacts its chunk; the parent only aligns categories and concatenates.
+    """
+    with span("transforms.enrich_parallel", workers=workers) as s:
+        payloads = [to_ipc(chunk) for chunk in _chunks(raw.reset_index(drop=True), workers)]
+        results = list(_get_pool(workers).map(_enrich_chunk, payloads))
+        frames = [from_ipc(result) for result in results]
+        df = pd.concat(align_categories(frames), ignore_index=True)
+        s.rows = len(df)
+    return df
+
+
+def enrich_frame(raw: pd.DataFrame, workers: int = 1, min_rows: int = 200_000) -> pd.DataFrame:
+    """Enrich in-process, or across a process pool for frames of at least ``min_rows``."""
+    if workers <= 1 or len(raw) < min_rows:
+        return enrich_dataframe(raw)
+    return enrich_parallel(raw, workers)
@@ -0,0 +1,123 @@
+from typing import Iterable
+
+import pandas as pd
+from bson import ObjectId
+
+from st_dashboard.data.decode import decode_cursor
+
+
+def _mentions_model(expr):
+    return {"$regexMatch": {"input": expr, "regex": "model", "options": "i"}}
+
+
+def _model_inputs_expr(path: str = "$modelConfig.inputs"):
+    # Keep only the inputs whose id/key mentions "model": all _extract_from_inputs reads
+    return {
+        "$cond": [
+            {"$isArray": path},
+            {
+                "$map": {
+                    "input": {
+                        "$filter": {
+                            "input": path,
+                            "as": "item",
+                            "cond": _mentions_model({"$toString": {"$ifNull": ["$$item.id", ""]}}),
+                        }
+                    },
+                    "as": "item",
+                    "in": {
+                        "id": "$$item.id",
+                        "value": "$$item.value",
+                        "defaultValue": "$$item.defaultValue",
+                    },
+                }
+            },
+            {
+                "$cond": [
+                    {"$eq": [{"$type": path}, "object"]},
+                    {
+                        "$arrayToObject": {
+                            "$filter": {
+                                "input": {"$objectToArray": path},
+                                "as": "kv",
+                                "cond": _mentions_model("$$kv.k"),
+                            }
+                        }
+                    },
+                    "$$REMOVE",
+                ]
+            },
+        ]
+    }
+
+
+# Slim projection used for every dashboard load. Long free-text fields and cost rules
+# stay in Mongo; has_rewrite is computed server-side and inputs are trimmed to the
+# model-choice entries.
+BASE_PROJECTION = {
+    "_id": 1,
+    "jobId": 1,
+    "userId": 1,
+    "createdAt": 1,
+    "updatedAt": 1,
+    "status": 1,
+    "modelConfig.id": 1,
+    "modelConfig.name": 1,
+    "modelConfig.modelTitle": 1,
+    "modelConfig.modelType": 1,
+    "modelConfig.outputType": 1,
+    "modelConfig.provider": 1,
+    "modelConfig.inputs": _model_inputs_expr(),
+    "modelConfig.costConfig.defaultCost": 1,
+    "modelConfig.modelMetaData.openAIModelId": 1,
+    "qualityAnalysis.score": 1,
+    "qualityAnalysis.transformedScore": 1,
+    "qualityAnalysis.qualityCheckStatus": 1,
+    "resultDownloadedAt": 1,
+    "error.code": 1,
+    # Same rule as the client-side fallback: present and non-empty once stringified,
+    # so non-string prompts count as rewrites instead of failing the whole query
+    "has_rewrite": {
+        "$let": {
+            "vars": {"prompt": "$qualityAnalysis.rewrittenPrompt"},
+            "in": {
+                "$switch": {
+                    "branches": [
+                        {"case": {"$in": [{"$type": "$$prompt"}, ["missing", "null"]]}, "then": False},
+                        {
+                            "case": {"$eq": [{"$type": "$$prompt"}, "string"]},
+                            "then": {"$gt": [{"$strLenCP": "$$prompt"}, 0]},
+                        },
+                    ],
+                    "default": True,
+                }
+            },
+        }
+    },
+}
+
+# Heavy fields, fetched only for the jobs a user drills into
+DETAIL_PROJECTION = {
+    "_id": 1,
+    "qualityAnalysis.rewrittenPrompt": 1,
+    "qualityAnalysis.reasoning": 1,
+    "error.message": 1,
+    "modelConfig.inputs": 1,
+    "modelConfig.costConfig.rules": 1,
+}
+
+
+def _to_object_id(value):
+    value = str(value)
+    return ObjectId(value) if ObjectId.is_valid(value) else value
+
+
+def fetch_job_details(collection, job_ids: Iterable, max_time_ms: int = 10000) -> pd.DataFrame:
+    ids = [_to_object_id(job_id) for job_id in job_ids]
+    if not ids:
+        return pd.DataFrame(columns=list(DETAIL_PROJECTION))
+    cursor = collection.find({"_id": {"$in": ids}}, DETAIL_PROJECTION, max_time_ms=max_time_ms)
+    df = decode_cursor(cursor, DETAIL_PROJECTION)
+    if df.empty:
+        return pd.DataFrame(columns=list(DETAIL_PROJECTION))
+    return df.assign(_id=df["_id"].astype(str))
@@ -0,0 +1,161 @@
+import re
+import time
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from st_dashboard.data.aggregates import date_range_match
+from st_dashboard.data.constants import MODEL_TYPE_RULES
+from st_dashboard.data.incremental import IncrementalLoader
+
+Range = Tuple[datetime, datetime]
+
+
+def task_predicate(model_type: Optional[str]) -> dict:
+    """Index-friendly superset of the jobs ``classify_model_type`` assigns to ``model_type``.
+
+    First-match-wins cannot be expressed with plain field predicates, so this also
+    matches jobs an earlier rule claims; they are dropped after enrichment.
+    """
+    rule = next((r for r in MODEL_TYPE_RULES if r[0] == model_type), None)
+    if rule is None:
+        return {}
+    _, id_token, name_token = rule
+    clauses = [{"modelConfig.name": {"$regex": re.escape(name_token)}}]
+    if id_token is not None:
+        clauses.insert(0, {"modelConfig.id": {"$regex": re.escape(id_token), "$options": "i"}})
+    return {"$or": clauses}
+
+
+def to_range(start_date: date, end_date: date) -> Range:
+    created = date_range_match(start_date, end_date)["createdAt"]
+    return created["$gte"], created["$lt"]
+
+
+def merge_ranges(ranges: List[Range]) -> List[Range]:
+    merged: List[Range] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_ranges(covered: List[Range], start: datetime, end: datetime) -> List[Range]:
+    missing = []
+    cursor = start
+    for lo, hi in covered:
+        if hi <= cursor or lo >= end:
+            continue
+        if lo > cursor:
+            missing.append((cursor, lo))
+        cursor = max(cursor, hi)
+    if cursor < end:
+        missing.append((cursor, end))
+    return missing
+
+
+def _created_in(ranges: List[Range]) -> dict:
+    clauses = [{"createdAt": {"$gte": lo, "$lt": hi}} for lo, hi in ranges]
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+class RangeLoader(IncrementalLoader):
+    """Enriched jobs of one task, fetched only for the createdAt ranges asked for so far.
+
+    A request inside already-covered ranges is served from memory; otherwise only the
+    uncovered sub-ranges are read. Requests never refresh: covered ranges are kept
+    fresh by ``refresh()`` (the ``updatedAt`` watermark tail, run by a
+    ``BackgroundRefresher``) or by change-stream batches passed to ``apply_changes()``;
+    ``refreshed_at`` records the last of either.
+
+    With a ``snapshot`` the frame, the covered ranges and the watermark survive a
+    restart: the first request serves the saved ranges straight away, and the next
+    ``refresh()`` reads only the tail written since.
+
+    Refreshes and range loads build the new frame while holding only the writer lock
+    and publish it with one assignment. Requests for covered ranges read the published
+    frame without locking, so they never wait for a refresh in progress.
+    """
+
+    def __init__(self, collection, projection, model_type, **kwargs):
+        super().__init__(collection, projection, query=task_predicate(model_type), **kwargs)
+        self.model_type = model_type
+        self.covered: List[Range] = []
+        self.refreshed_at = None
+
+    def enrich(self, raw: pd.DataFrame) -> pd.DataFrame:
+        df = super().enrich(raw)
+        return df[df["model_type"] == self.model_type].reset_index(drop=True)
+
+    def _tail_query(self):
+        tail = super()._tail_query()
+        if not self.covered:
+            return tail
+        return {"$and": [tail, _created_in(self.covered)]}
+
+    def _restore(self):
+        super()._restore()
+        covered = self.snapshot.load_state().get("covered", [])
+        if not self.frame.empty:
+            self.covered = [
+                (datetime.fromisoformat(lo), datetime.fromisoformat(hi)) for lo, hi in covered
+            ]
+
+    def _save_snapshot(self, weeks):
+        covered = [[lo.isoformat(), hi.isoformat()] for lo, hi in self.covered]
+        self.snapshot.save(self.frame, self.watermark, weeks=weeks, state={"covered": covered})
+
+    def refresh(self) -> pd.DataFrame:
+        """Re-read updates for the covered ranges past the watermark."""
+        with self._lock:
+            if not self._restored:
+                self._restore()
+            if self.covered:
+                self.apply(self.fetch_delta())
+                self.refreshed_at = time.monotonic()
+            return self.frame
+
+    def apply_changes(self, raw: pd.DataFrame) -> pd.DataFrame:
+        """Upsert changed documents (e.g. a change-stream batch) that fall in the covered ranges.
+
+        Jobs outside the covered ranges are skipped: their range is read in full when
+        first asked for. Filtering under the writer lock means a range being loaded
+        concurrently is covered by the time a later change to it is filtered.
+        """
+        with self._lock:
+            if raw.empty or not self.covered or "createdAt" not in raw.columns:
+                return self.frame
+            created = pd.to_datetime(raw["createdAt"], errors="coerce", utc=True)
+            inside = pd.Series(False, index=raw.index)
+            for lo, hi in self.covered:
+                inside |= (created >= pd.Timestamp(lo)) & (created < pd.Timestamp(hi))
+            frame = self.apply(raw[inside])
+            # Every change up to this batch has been seen, whether or not it was kept
+            self.refreshed_at = time.monotonic()
+            return frame
+
+    def ensure(self, start_date: date, end_date: date) -> Tuple[pd.DataFrame, int]:
+        """Make sure [start_date, end_date] is loaded; returns the task's full ``(frame, version)``."""
+        start, end = to_range(start_date, end_date)
+        # ``covered`` is only extended after the frame holding the range is published
+        if not missing_ranges(self.covered, start, end):
+            return self.published
+        with self._lock:
+            if not self._restored:
+                self._restore()
+            # Ranges are read without moving the watermark, so the covered ranges'
+            # next tail refresh still starts from where they were last brought up to date
+            missing = missing_ranges(self.covered, start, end)
+            for lo, hi in missing:
+                query = _created_in([(lo, hi)])
+                if self.query:
+                    query = {"$and": [self.query, query]}
+                self.apply(self.fetch(query), advance_watermark=False)
+                self.covered = merge_ranges(self.covered + [(lo, hi)])
+            if missing and self.snapshot is not None:
+                # Record the newly covered ranges; the rows were saved by apply()
+                self._save_snapshot(weeks=[])
+            return self.published
@@ -0,0 +1,137 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRefresher:
+    """Stale-while-revalidate holder for a dataset rebuilt by ``refresh()``.
+
+    ``start()`` runs one refresh right away in a daemon thread and then one every
+    ``interval_seconds``; each result is swapped in with a single assignment, so readers
+    always get the last good value without waiting. A ``get()`` before the first refresh
+    has finished builds (or waits for) the value in the caller's thread. A failed
+    refresh keeps the previous value and is retried on the next tick.
+    """
+
+    def __init__(self, refresh: Callable, interval_seconds: float, name: str = "refresher"):
+        self.refresh = refresh
+        self.interval_seconds = interval_seconds
+        self.name = name
+        # (value, generation) is swapped as one tuple so readers never see a mix
+        self._current = None
+        self.refreshed_at: Optional[float] = None
+        self.duration: Optional[float] = None
+        self.last_error: Optional[BaseException] = None
+        self._build_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _rebuild(self):
+        started = time.monotonic()
+        try:
+            value = self.refresh()
+        except Exception as exc:
+            self.last_error = exc
+            logger.warning("%s: refresh failed, keeping the previous value: %s", self.name, exc)
+            raise
+        generation = 0 if self._current is None else self._current[1] + 1
+        self._current = (value, generation)
+        self.duration = time.monotonic() - started
+        self.refreshed_at = time.monotonic()
+        self.last_error = None
+
+    def _tick(self, initial=False):
+        try:
+            with self._build_lock:
+                # The start-up pass is skipped when a reader already built the first value
+                if not (initial and self._current is not None):
+                    self._rebuild()
+        except Exception:
+            pass
+
+    def _run(self):
+        self._tick(initial=True)
+        while not self._stop.wait(self.interval_seconds):
+            self._tick()
+
+    def start(self) -> "BackgroundRefresher":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def snapshot(self):
+        """The current ``(value, generation)``; the generation changes on every swap."""
+        if self._current is None:
+            # Only the very first build blocks, and concurrent first readers share it
+            with self._build_lock:
+                if self._current is None:
+                    self._rebuild()
+        return self._current
+
+    def get(self):
+        return self.snapshot()[0]
+
+    def age(self) -> Optional[float]:
+        """Seconds since the last successful refresh."""
+        if self.refreshed_at is None:
+            return None
+        return time.monotonic() - self.refreshed_at
+
+
+class StaleCache:
+    """Keyed stale-while-revalidate cache for values built by ``build(*key)``.
+
+    The first reader of a key builds it in its own thread. Once an entry is older than
+    ``ttl_seconds`` it is still returned as is, and a daemon thread rebuilds it for the
+    next reader; a failed rebuild keeps the stale value and is retried on a later
+    ``get()``. At most ``max_entries`` keys are kept, least recently read first out.
+    """
+
+    def __init__(self, build: Callable, ttl_seconds: float, max_entries: int = 64, name: str = "cache"):
+        self.build = build
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.name = name
+        self._entries: OrderedDict = OrderedDict()
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def _store(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _revalidate(self, key):
+        try:
+            self._store(key, self.build(*key))
+        except Exception as exc:
+            logger.warning("%s: rebuild of %r failed, keeping the stale value: %s", self.name, key, exc)
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def get(self, *key):
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None:
+                self._entries.move_to_end(key)
+                expired = time.monotonic() - hit[1] >= self.ttl_seconds
+                if expired and key not in self._pending:
+                    self._pending.add(key)
+                    threading.Thread(
+                        target=self._revalidate, args=(key,), name=self.name, daemon=True
+                    ).start()
+                return hit[0]
+        value = self.build(*key)
+        self._store(key, value)
+        return value
@@ -0,0 +1,305 @@
+"""Local aggregate server: one process owns the data, Streamlit workers fetch slices.
+
+    uv run python -m st_dashboard.data.service --port 8765
+
+Workers started with ``AGGREGATE_SERVER_URL=http://127.0.0.1:8765`` no longer read
+MongoDB or hold job frames; they receive the cube cells, histograms and rollups each
+chart needs as Arrow IPC responses.
+"""
+
+import argparse
+import sys
+import threading
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlencode, urlparse
+from urllib.request import urlopen
+
+import pandas as pd
+
+from st_dashboard.data.aggregates import run_facets, run_weekly_rollup
+from st_dashboard.data.cube import build_cube, slice_cube
+from st_dashboard.data.distributions import build_quality_hist
+from st_dashboard.data.frozen import freeze_frame
+from st_dashboard.data.ipc import from_ipc, from_ipc_frames, to_ipc, to_ipc_frames
+from st_dashboard.data.projections import BASE_PROJECTION, fetch_job_details
+from st_dashboard.data.pushdown import RangeLoader
+from st_dashboard.data.refresher import BackgroundRefresher, StaleCache
+from st_dashboard.data.time_index import TimeIndex
+
+VERSION_HEADER = "X-Data-Version"
+RECENT_JOB_COLUMNS = ["_id", "created_at", "status", "quality_score", "was_downloaded"]
+
+
+def recent_jobs_frame(index: TimeIndex, start_date, end_date, title, limit=20) -> pd.DataFrame:
+    """Latest ``limit`` jobs of one model title within the date range."""
+    jobs = index.select(start_date, end_date)
+    jobs = jobs[jobs["model_title_extracted"] == title].nlargest(limit, "created_at")
+    return jobs[RECENT_JOB_COLUMNS].reset_index(drop=True)
+
+
+class TaskDerived:
+    """Cube, quality histogram and time index of each task, built once per frame version.
+
+    Only the newest version of each is kept, so a superseded frame is released as
+    soon as its replacement has been derived. Values are shared, not copied.
+    """
+
+    BUILDERS = {
+        "cube": lambda frame: freeze_frame(build_cube(frame)),
+        "quality_hist": lambda frame: freeze_frame(build_quality_hist(frame)),
+        "index": TimeIndex,
+    }
+
+    def __init__(self):
+        self._latest = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind, model_type, frame, version):
+        key = (model_type, kind)
+        with self._lock:
+            latest = self._latest.get(key)
+        if latest is not None and latest[0] == version:
+            return latest[1]
+        value = self.BUILDERS[kind](frame)
+        with self._lock:
+            self._latest[key] = (version, value)
+        return value
+
+
+class AggregateService:
+    """The data one dashboard process would hold, shared by every worker that asks.
+
+    Task frames are kept by ``RangeLoader`` and refreshed in the background; cubes,
+    histograms and time indexes are rebuilt once per loader version. MongoDB-side
+    rollups and facets are rebuilt in the background once ``rollup_ttl`` seconds old,
+    and at most ``rollup_entries`` of each are kept (least recently used first out).
+    """
+
+    def __init__(
+        self, collection, refresh_seconds=600, rollup_ttl=900, rollup_entries=64, **loader_options
+    ):
+        self.collection = collection
+        self.refresh_seconds = refresh_seconds
+        self.loader_options = loader_options
+        self._lock = threading.Lock()
+        self._tasks = {}
+        self._derived = TaskDerived()
+        self._facets = StaleCache(
+            self._build_facets, rollup_ttl, max_entries=rollup_entries, name="facets"
+        )
+        self._rollups = StaleCache(
+            self._build_weekly_rollup, rollup_ttl, max_entries=rollup_entries, name="weekly-rollup"
+        )
+
+    def _task(self, model_type):
+        with self._lock:
+            if model_type not in self._tasks:
+                loader = RangeLoader(
+                    self.collection, BASE_PROJECTION, model_type, **self.loader_options
+                )
+                refresher = BackgroundRefresher(
+                    loader.refresh, self.refresh_seconds, name=f"task:{model_type}"
+                ).start()
+                self._tasks[model_type] = (loader, refresher)
+            return self._tasks[model_type][0]
+
+    def task_slices(self, model_type, start_date, end_date):
+        """(version, cube cells, quality histogram) for one task and date range."""
+        frame, version = self._task(model_type).ensure(start_date, end_date)
+        cube = self._derived.get("cube", model_type, frame, version)
+        hist = self._derived.get("quality_hist", model_type, frame, version)
+        return version, slice_cube(cube, start_date, end_date), slice_cube(hist, start_date, end_date)
+
+    def recent_jobs(self, model_type, start_date, end_date, title, limit=20):
+        frame, version = self._task(model_type).ensure(start_date, end_date)
+        index = self._derived.get("index", model_type, frame, version)
+        return recent_jobs_frame(index, start_date, end_date, title, limit)
+
+    def _build_facets(self, group_col):
+        return run_facets(self.collection, group_col=group_col)
+
+    def _build_weekly_rollup(self, group_col, start_date, end_date, model_types):
+        return run_weekly_rollup(
+            self.collection,
+            group_col=group_col,
+            start_date=start_date,
+            end_date=end_date,
+            model_types=model_types,
+        )
+
+    def facets(self, group_col):
+        return self._facets.get(group_col)
+
+    def weekly_rollup(self, group_col, start_date=None, end_date=None, model_types=None):
+        return self._rollups.get(group_col, start_date, end_date, model_types)
+
+    def job_details(self, job_ids):
+        return fetch_job_details(self.collection, job_ids)
+
+
+def _date(params, name) -> Optional[date]:
+    value = params.get(name, [""])[0]
+    return date.fromisoformat(value) if value else None
+
+
+def _list(params, name) -> Optional[tuple]:
+    value = params.get(name, [""])[0]
+    return tuple(value.split(",")) if value else None
+
+
+def _text(params, name, default=None):
+    return params.get(name, [default])[0]
+
+
+def _handler(service: AggregateService):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, result, version=None):
+            # A tuple of frames (e.g. cells and histogram) travels as one framed payload
+            if isinstance(result, tuple):
+                body, content_type = to_ipc_frames(result), "application/octet-stream"
+            else:
+                body, content_type = to_ipc(result), "application/vnd.apache.arrow.stream"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            if version is not None:
+                self.send_header(VERSION_HEADER, str(version))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _route(self, path, params):
+            if path == "/facets":
+                return service.facets(_text(params, "group_col", "model_type_agg")), None
+            if path == "/weekly_rollup":
+                return service.weekly_rollup(
+                    _text(params, "group_col", "model_type_agg"),
+                    start_date=_date(params, "start"),
+                    end_date=_date(params, "end"),
+                    model_types=_list(params, "model_types"),
+                ), None
+            if path == "/task_slices":
+                # Cells and histogram go out together so both come from the same version
+                version, cells, hist = service.task_slices(
+                    _text(params, "model_type"), _date(params, "start"), _date(params, "end")
+                )
+                return (cells, hist), version
+            if path == "/recent_jobs":
+                return service.recent_jobs(
+                    _text(params, "model_type"),
+                    _date(params, "start"),
+                    _date(params, "end"),
+                    _text(params, "title"),
+                    int(_text(params, "limit", "20")),
+                ), None
+            if path == "/job_details":
+                return service.job_details(_list(params, "ids") or ()), None
+            return None, None
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            try:
+                result, version = self._route(url.path, parse_qs(url.query))
+            except Exception as exc:
+                self.send_error(500, explain=f"{type(exc).__name__}: {exc}")
+                return
+            if result is None:
+                self.send_error(404)
+                return
+            self._send(result, version)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def make_server(service: AggregateService, host="127.0.0.1", port=8765) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), _handler(service))
+    server.daemon_threads = True
+    return server
+
+
+class AggregateClient:
+    """HTTP client for ``AggregateService``; every call returns a DataFrame."""
+
+    def __init__(self, base_url: str, timeout: float = 30):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def _fetch(self, path, **params):
+        query = urlencode(
+            {
+                key: ",".join(map(str, value)) if isinstance(value, (list, tuple)) else value
+                for key, value in params.items()
+                if value is not None
+            }
+        )
+        with urlopen(f"{self.base_url}{path}?{query}", timeout=self.timeout) as response:
+            return response.read(), response.headers.get(VERSION_HEADER)
+
+    def _get(self, path, **params):
+        payload, version = self._fetch(path, **params)
+        return from_ipc(payload), version
+
+    def facets(self, group_col):
+        return self._get("/facets", group_col=group_col)[0]
+
+    def weekly_rollup(self, group_col, start_date=None, end_date=None, model_types=None):
+        return self._get(
+            "/weekly_rollup",
+            group_col=group_col,
+            start=start_date,
+            end=end_date,
+            model_types=model_types,
+        )[0]
+
+    def task_slices(self, model_type, start_date, end_date):
+        payload, version = self._fetch(
+            "/task_slices", model_type=model_type, start=start_date, end=end_date
+        )
+        cells, hist = from_ipc_frames(payload)
+        return int(version), cells, hist
+
+    def recent_jobs(self, model_type, start_date, end_date, title, limit=20):
+        return self._get(
+            "/recent_jobs",
+            model_type=model_type,
+            start=start_date,
+            end=end_date,
+            title=title,
+            limit=limit,
+        )[0]
+
+    def job_details(self, job_ids):
+        return self._get("/job_details", ids=tuple(job_ids))[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve dashboard aggregates over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    from config.settings import settings
+    from src.mongo.mongo_db_client import get_collection
+
+    service = AggregateService(
+        get_collection("renderboard", "assetGenJobs"),
+        refresh_seconds=settings.refresh_interval_seconds,
+        max_time_ms=settings.fetch_shard_timeout_ms,
+        batch_size=settings.fetch_batch_size,
+        max_bytes=settings.fetch_max_bytes,
+        shards=settings.fetch_shards,
+        retries=settings.fetch_shard_retries,
+        enrich_workers=settings.enrich_workers,
+        enrich_min_rows=settings.enrich_min_rows,
+    )
+    server = make_server(service, args.host, args.port)
+    print(f"Serving aggregates on http://{args.host}:{args.port}", file=sys.stderr)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import pandas as pd
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import PyMongoError
+
+from st_dashboard.data.decode import ByteBudget, concat_decoded, decode_cursor
+from st_dashboard.instrumentation import span
+
+logger = logging.getLogger(__name__)
+
+SHARD_FIELD = "createdAt"
+
+
+def _and(query: dict, clause: dict) -> dict:
+    return {"$and": [query, clause]} if query else clause
+
+
+def created_bounds(collection, query: dict, max_time_ms: int) -> Optional[Tuple[datetime, datetime]]:
+    """Smallest and largest ``createdAt`` matching ``query`` (two index-backed lookups)."""
+    dated = _and(query, {SHARD_FIELD: {"$type": "date"}})
+    bounds = []
+    for direction in (ASCENDING, DESCENDING):
+        docs = list(
+            collection.find(dated, {SHARD_FIELD: 1}, max_time_ms=max_time_ms)
+            .sort(SHARD_FIELD, direction)
+            .limit(1)
+        )
+        if not docs:
+            return None
+        bounds.append(docs[0][SHARD_FIELD])
+    return bounds[0], bounds[1]
+
+
+def shard_ranges(lo: datetime, hi: datetime, shards: int) -> List[Tuple[datetime, datetime]]:
+    """Split [lo, hi] into ``shards`` half-open ranges; the last one ends just past ``hi``."""
+    end = hi + timedelta(milliseconds=1)
+    step = (end - lo) / shards
+    edges = [lo + step * i for i in range(shards)] + [end]
+    # Mongo dates have millisecond precision; keep the edges on that grid
+    edges = [e.replace(microsecond=e.microsecond // 1000 * 1000) for e in edges]
+    return [(a, b) for a, b in zip(edges, edges[1:]) if a < b]
+
+
+def shard_queries(query: dict, ranges) -> List[dict]:
+    queries = [_and(query, {SHARD_FIELD: {"$gte": lo, "$lt": hi}}) for lo, hi in ranges]
+    # Jobs without a date createdAt fall outside every range; read them on their own
+    queries.append(_and(query, {SHARD_FIELD: {"$not": {"$type": "date"}}}))
+    return queries
+
+
+def _fetch_shard(collection, query, projection, max_time_ms, retries, batch_size, budget):
+    for attempt in range(retries + 1):
+        try:
+            cursor = collection.find(query, projection, max_time_ms=max_time_ms).batch_size(batch_size)
+            return decode_cursor(cursor, projection, batch_size=batch_size, budget=budget)
+        except PyMongoError as exc:
+            if attempt == retries:
+                raise
+            logger.warning("Shard fetch failed (attempt %d/%d): %s", attempt + 1, retries + 1, exc)
+            time.sleep(0.5 * 2 ** attempt)
+
+
+def fetch_sharded(
+    collection,
+    query: Optional[dict],
+    projection: dict,
+    shards: int = 4,
+    max_time_ms: int = 10000,
+    retries: int = 2,
+    batch_size: int = 5000,
+    max_bytes: Optional[int] = None,
+) -> pd.DataFrame:
+    """Read ``query`` as ``shards`` concurrent ``createdAt`` ranges and concatenate them.
+
+    Every shard gets its own ``max_time_ms`` and is retried on its own, so one slow
+    or dropped cursor does not fail the whole load. Threads share the client's
+    connection pool, so server-side scans and network waits overlap; decoding itself
+    still takes turns on the GIL. ``max_bytes`` is one budget for all shards together.
+    """
+    query = dict(query or {})
+    budget = ByteBudget(max_bytes) if max_bytes is not None else None
+    bounds = created_bounds(collection, query, max_time_ms) if shards > 1 else None
+    if bounds is None:
+        queries = [query]
+    else:
+        queries = shard_queries(query, shard_ranges(*bounds, shards))
+
+    def run(shard_query):
+        with span("mongo.shard") as s:
+            df = _fetch_shard(
+                collection, shard_query, projection, max_time_ms, retries, batch_size, budget
+            )
+            s.rows = len(df)
+        return df
+
+    with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+        # Each shard runs in a copy of the caller's context so its span is recorded
+        futures = [pool.submit(contextvars.copy_context().run, run, q) for q in queries]
+        frames = [future.result() for future in futures]
+
+    return concat_decoded(frames, projection)
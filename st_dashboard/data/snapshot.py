@@ -0,0 +1,138 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Bump when enrich_dataframe output changes so stale snapshots are rebuilt
+SNAPSHOT_FORMAT = 2
+PARTITION_COL = "isoweek"
+NO_WEEK = "none"
+
+
+def query_key(query=None) -> str:
+    raw = json.dumps(query or {}, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()[:12]
+
+
+def _partition_name(week) -> str:
+    return f"week={NO_WEEK if pd.isna(week) else int(week)}.parquet"
+
+
+def _is_nested(value) -> bool:
+    return isinstance(value, (list, dict))
+
+
+def _to_table(df: pd.DataFrame) -> pa.Table:
+    # Nested Mongo values (e.g. costConfig.rules) are not used by the charts and do not
+    # map cleanly to a column type, so they stay out of the snapshot.
+    nested = [
+        col for col in df.columns
+        if df[col].dtype == object and df[col].map(_is_nested).any()
+    ]
+    df = df.drop(columns=nested)
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        try:
+            pa.array(df[col], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+            df[col] = df[col].map(lambda v: v if pd.isna(v) else str(v))
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+class SnapshotStore:
+    """Enriched frame persisted as one Parquet file per ISO week, plus a small manifest.
+
+    Only weeks touched by a refresh are rewritten. Files are read memory-mapped.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.manifest_path = self.root / "manifest.json"
+
+    def _read_manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {}
+        manifest = json.loads(self.manifest_path.read_text())
+        if manifest.get("format") != SNAPSHOT_FORMAT:
+            return {}
+        return manifest
+
+    @property
+    def version(self) -> int:
+        return self._read_manifest().get("version", 0)
+
+    def load(self):
+        """Return (frame, watermark), or (None, None) when there is no usable snapshot."""
+        manifest = self._read_manifest()
+        if not manifest:
+            return None, None
+        tables = [
+            pq.read_table(self.root / name, memory_map=True)
+            for name in manifest.get("partitions", [])
+            if (self.root / name).exists()
+        ]
+        if not tables:
+            return None, None
+        frame = pa.concat_tables(tables, promote_options="default").to_pandas()
+        watermark = manifest.get("watermark")
+        return frame, datetime.fromisoformat(watermark) if watermark else None
+
+    def _write_atomic(self, path: Path, write):
+        tmp = path.with_name(path.name + ".tmp")
+        write(tmp)
+        os.replace(tmp, path)
+
+    def load_state(self) -> dict:
+        """The loader state saved with the snapshot (e.g. a task's covered ranges)."""
+        return self._read_manifest().get("state", {})
+
+    def save(
+        self,
+        frame: pd.DataFrame,
+        watermark: Optional[datetime],
+        weeks: Optional[Iterable] = None,
+        state: Optional[dict] = None,
+    ):
+        """Rewrite the partitions for ``weeks`` (all weeks when None) and the manifest.
+
+        ``state`` is kept in the manifest as JSON for the loader to read back.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        manifest = self._read_manifest()
+        if weeks is None:
+            manifest = {}
+            for stale in self.root.glob("week=*.parquet"):
+                stale.unlink()
+        partitions = set(manifest.get("partitions", []))
+
+        wanted = None if weeks is None else {(-1 if pd.isna(w) else int(w)) for w in weeks}
+        # A loader that has matched no jobs yet has no columns at all
+        if wanted != set() and PARTITION_COL in frame.columns:
+            by_week = frame[PARTITION_COL].astype("Int64").fillna(-1)
+            for week, part in frame.groupby(by_week, sort=False):
+                if wanted is not None and week not in wanted:
+                    continue
+                name = _partition_name(None if week == -1 else week)
+                table = _to_table(part)
+                self._write_atomic(self.root / name, lambda p: pq.write_table(table, p))
+                partitions.add(name)
+
+        manifest = {
+            "format": SNAPSHOT_FORMAT,
+            "version": manifest.get("version", 0) + 1,
+            "watermark": watermark.isoformat() if watermark else None,
+            "rows": int(len(frame)),
+            "partitions": sorted(partitions),
+            "state": state or {},
+        }
+        self._write_atomic(
+            self.manifest_path, lambda p: p.write_text(json.dumps(manifest, indent=2))
+        )
+        return manifest["version"]
@@ -0,0 +1,57 @@
+from datetime import date
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from st_dashboard.data.aggregates import date_range_match
+
+TIME_COL = "created_at"
+
+
+def _is_sorted(epoch: np.ndarray) -> bool:
+    return bool(np.all(epoch[1:] >= epoch[:-1]))
+
+
+def sort_by_created(df: pd.DataFrame) -> pd.DataFrame:
+    """Order rows by ``created_at`` with NaT first, so its int64 view is non-decreasing."""
+    if df.empty or TIME_COL not in df.columns or _is_sorted(df[TIME_COL].array.asi8):
+        return df
+    # Refreshes append a small delta to an already sorted frame; a stable sort is
+    # close to linear on that input.
+    return df.sort_values(TIME_COL, kind="stable", na_position="first", ignore_index=True)
+
+
+def _epoch_ns(value) -> int:
+    return pd.Timestamp(value).value
+
+
+class TimeIndex:
+    """Range lookups on a frame sorted by ``created_at``.
+
+    Date ranges are resolved with ``searchsorted`` on the int64 view of the time
+    column and returned as positional slices.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = sort_by_created(df)
+        if self.df.empty:
+            self.epoch = np.empty(0, dtype="int64")
+        else:
+            self.epoch = self.df[TIME_COL].array.asi8
+
+    def bounds(self, start_date: Optional[date] = None, end_date: Optional[date] = None):
+        created = date_range_match(start_date, end_date).get("createdAt", {})
+        if "$gte" in created:
+            lo = int(self.epoch.searchsorted(_epoch_ns(created["$gte"]), side="left"))
+        else:
+            # NaT is the smallest int64 and sorts first; an open start still skips it
+            lo = int(self.epoch.searchsorted(np.iinfo("int64").min, side="right"))
+        hi = len(self.epoch)
+        if "$lt" in created:
+            hi = int(self.epoch.searchsorted(_epoch_ns(created["$lt"]), side="left"))
+        return lo, max(lo, hi)
+
+    def select(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> pd.DataFrame:
+        lo, hi = self.bounds(start_date, end_date)
+        return self.df.iloc[lo:hi]
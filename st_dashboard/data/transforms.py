@@ -1,38 +1,70 @@
 import re
 import colorsys
+import logging
+from collections.abc import Hashable
+from functools import lru_cache
 from typing import Dict, Iterable
 
 import pandas as pd
 import numpy as np
-from matplotlib.colors import to_rgb, to_hex
 
-from st_dashboard.data.constants import AGG_MODEL_TYPES, FAMILY_RULES, FAMILY_BASE_COLORS
+from st_dashboard.instrumentation import timed
+from st_dashboard.data.constants import (
+    AGG_MODEL_TYPES,
+    FAMILY_RULES,
+    FAMILY_BASE_COLORS,
+    MODEL_TYPE_RULES,
+)
+
+# Fields the model columns depend on; jobs sharing them resolve identically
+MODEL_CONFIG_FIELDS = [
+    "modelConfig.id",
+    "modelConfig.name",
+    "modelConfig.provider",
+    "modelConfig.modelTitle",
+    "modelConfig.modelMetaData.openAIModelId",
+]
+MODEL_DIMENSION_COLUMNS = ["model_type", "model_type_agg", "model_title_extracted", "model_family"]
+
+# Storage types for the enriched frame. Raw columns that were copied into a derived
+# column (created_at, default_cost, quality_score) are dropped. Costs stay float64 so
+# large weekly sums keep cent precision.
+COMPACT_SCHEMA = {
+    "drop": ["createdAt", "modelConfig.costConfig.defaultCost", "qualityAnalysis.score"],
+    "category": [
+        "userId",
+        "status",
+        "modelConfig.id",
+        "modelConfig.name",
+        "modelConfig.modelTitle",
+        "modelConfig.modelType",
+        "modelConfig.outputType",
+        "modelConfig.provider",
+        "modelConfig.modelMetaData.openAIModelId",
+        "qualityAnalysis.qualityCheckStatus",
+        "error.code",
+        "model_type",
+        "model_type_agg",
+        "model_title_extracted",
+        "model_family",
+    ],
+    "float32": ["quality_score", "qualityAnalysis.transformedScore"],
+    "bool": ["was_downloaded", "has_rewrite"],
+}
+
+logger = logging.getLogger(__name__)
 
 
 def classify_model_type(model_id: str, model_name: str) -> str:
-    model_id = (model_id or "").lower()
-    model_name = model_name or ""
-
-    if "t2i" in model_id or "Text to Image" in model_name:
-        return "t2i"
-    if "i2i" in model_id or "Image to Image" in model_name:
-        return "i2i"
-    if "i2v" in model_id or "Image to Video" in model_name:
-        return "i2v"
-    if "v2v" in model_id or "Video to Video" in model_name:
-        return "v2v"
-    if "t2v" in model_id or "Text to Video" in model_name:
-        return "t2v"
-    if "t2s" in model_id or "Text to Speech" in model_name:
-        return "t2s"
-    if "s2v" in model_id or "Speech to Video" in model_name:
-        return "s2v"
-    if "Minimatics" in model_name:
-        return "minimatics"
-    if "Character Models" in model_name:
-        return "character_models"
-    if "Sound Effects" in model_name:
-        return "sound_effects"
+    # Non-string ids/names (numbers, NaN) are matched on their text, as in classify_model_types
+    model_id = str(model_id or "").lower()
+    model_name = str(model_name or "")
+
+    for model_type, id_token, name_token in MODEL_TYPE_RULES:
+        if id_token is not None and id_token in model_id:
+            return model_type
+        if name_token in model_name:
+            return model_type
     return "unknown"
 
 
@@ -93,33 +125,167 @@ def extract_model_title(row: pd.Series) -> str:
     return row.get("modelConfig.modelTitle")
 
 
+def _column(df: pd.DataFrame, col: str) -> pd.Series:
+    if col in df.columns:
+        return df[col]
+    # None rather than NaN, like ``row.get`` on a missing field
+    return pd.Series([None] * len(df), index=df.index, dtype=object)
+
+
+def _truthy(s: pd.Series) -> np.ndarray:
+    # Same truthiness as the scalar ``value or default`` (None/"" are falsy, NaN is not)
+    return s.map(bool).to_numpy(dtype=bool)
+
+
+def _or_default(s: pd.Series, default) -> np.ndarray:
+    return np.where(_truthy(s), s.to_numpy(dtype=object), default)
+
+
+def resolve_per_key(keys: pd.DataFrame, resolve) -> pd.DataFrame:
+    """Run ``resolve`` once per distinct row of ``keys`` and broadcast back to every row."""
+    codes = keys.groupby(list(keys.columns), dropna=False, sort=False).ngroup().to_numpy()
+    _, first_idx = np.unique(codes, return_index=True)
+    resolved = resolve(keys.iloc[first_idx].reset_index(drop=True))
+    out = resolved.iloc[codes]
+    out.index = keys.index
+    return out
+
+
+def classify_model_types(model_ids: pd.Series, model_names: pd.Series) -> pd.Series:
+    """Vectorized ``classify_model_type``: ordered masks, first matching rule wins."""
+    ids = model_ids.fillna("").astype(str).str.lower()
+    names = model_names.fillna("").astype(str)
+    conditions = []
+    choices = []
+    for model_type, id_token, name_token in MODEL_TYPE_RULES:
+        cond = names.str.contains(name_token, regex=False)
+        if id_token is not None:
+            cond |= ids.str.contains(id_token, regex=False)
+        conditions.append(cond.to_numpy(dtype=bool))
+        choices.append(model_type)
+    if not conditions or len(ids) == 0:
+        return pd.Series("unknown", index=model_ids.index, dtype=object)
+    return pd.Series(
+        np.select(conditions, choices, default="unknown"), index=model_ids.index, dtype=object
+    )
+
+
+def _normalize_replicate_ids(model_ids: pd.Series, model_type: str) -> pd.Series:
+    prefix = f"{model_type}-"
+    ids = model_ids.astype(str)
+    stripped = ids.where(~ids.str.startswith(prefix), ids.str[len(prefix):])
+    return stripped.where(_truthy(model_ids), None)
+
+
+def extract_model_titles(df: pd.DataFrame, inputs_choice: pd.Series = None) -> pd.Series:
+    """Vectorized ``extract_model_title`` over a frame that already has ``model_type``.
+
+    ``inputs_choice`` can carry an already-parsed ``modelConfig.inputs`` model choice.
+    """
+    model_type = _column(df, "model_type").to_numpy(dtype=object)
+    if "modelConfig.provider" in df.columns:
+        provider = df["modelConfig.provider"].astype(str).str.upper().to_numpy(dtype=object)
+    else:
+        provider = np.full(len(df), "", dtype=object)
+    titles = _column(df, "modelConfig.modelTitle").to_numpy(dtype=object, copy=True)
+
+    mask = model_type == "t2s"
+    if mask.any():
+        if inputs_choice is None:
+            choice = _column(df, "modelConfig.inputs")[mask].map(_extract_from_inputs)
+        else:
+            choice = inputs_choice[mask]
+        titles[mask] = _or_default(choice, "unknown_t2s_model")
+
+    mask = (model_type == "i2i") & (provider == "OPENAI")
+    if mask.any():
+        openai_ids = _column(df, "modelConfig.modelMetaData.openAIModelId")[mask]
+        titles[mask] = _or_default(openai_ids, "unknown_openai_model")
+
+    for model_type_value, providers, default in (
+        ("i2i", ("REPLICATE",), "unknown_replicate_model"),
+        ("t2i", ("OPENAI", "REPLICATE"), "unknown_model"),
+    ):
+        mask = (model_type == model_type_value) & np.isin(provider, providers)
+        if mask.any():
+            normalized = _normalize_replicate_ids(_column(df, "modelConfig.id")[mask], model_type_value)
+            titles[mask] = _or_default(normalized, default)
+
+    return pd.Series(titles, index=df.index, dtype=object)
+
+
+@timed("transforms.add_time_columns")
 def add_time_columns(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
+    # Shallow: new columns go into this frame only and the caller's data is not copied
+    df = df.copy(deep=False)
     created = pd.to_datetime(df.get("createdAt"), errors="coerce", utc=True)
     df["created_at"] = created
-    df["dt"] = created.dt.strftime("%Y-%m-%d")
+    # Day and week columns stay numeric/datetime; see isoweek_labels/day_labels for strings
+    df["dt"] = created.dt.floor("D")
     iso = created.dt.isocalendar()
     df["isoyear"] = iso["year"]
-    df["isoweek"] = iso.apply(lambda x: f"{x['year']}{x['week']:02d}", axis=1)
-    df["week_start"] = created.dt.to_period("W").dt.start_time
+    df["isoweek"] = iso["year"].astype("Int32") * 100 + iso["week"].astype("Int32")
+    day = created.dt.tz_localize(None).dt.normalize()
+    df["week_start"] = day - pd.to_timedelta(created.dt.weekday, unit="D")
     return df
 
 
-def add_model_columns(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    df["model_type"] = df.apply(
-        lambda row: classify_model_type(row.get("modelConfig.id"), row.get("modelConfig.name")),
-        axis=1,
-    )
-    df["model_type_agg"] = df["model_type"].apply(
-        lambda x: x if x in AGG_MODEL_TYPES else "other"
+def isoweek_labels(isoweek: pd.Series) -> pd.Series:
+    return isoweek.astype("string")
+
+
+def day_labels(dt: pd.Series) -> pd.Series:
+    # Format each distinct day once rather than once per job
+    days = dt.dropna().drop_duplicates()
+    return dt.map(pd.Series(days.dt.strftime("%Y-%m-%d").to_numpy(), index=days))
+
+
+def _hashable(value):
+    return value if isinstance(value, Hashable) else str(value)
+
+
+def resolve_model_config(dim: pd.DataFrame) -> pd.DataFrame:
+    """Model columns for one row per distinct model config (see ``MODEL_CONFIG_FIELDS``)."""
+    out = pd.DataFrame(index=dim.index)
+    out["model_type"] = classify_model_types(dim["modelConfig.id"], dim["modelConfig.name"])
+    out["model_type_agg"] = np.where(out["model_type"].isin(AGG_MODEL_TYPES), out["model_type"], "other")
+    out["model_title_extracted"] = extract_model_titles(
+        dim.assign(model_type=out["model_type"]), inputs_choice=dim["inputs_choice"]
     )
-    df["model_title_extracted"] = df.apply(extract_model_title, axis=1)
-    return df
+    out["model_family"] = out["model_title_extracted"].map(detect_family)
+    return out
 
 
+@timed("transforms.add_model_columns")
+def add_model_columns(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy(deep=False)
+    keys = pd.DataFrame({col: _column(df, col) for col in MODEL_CONFIG_FIELDS}, index=df.index)
+    # Missing fields resolve the same way whether they came back as None or NaN
+    keys = keys.astype(object).where(keys.notna(), None)
+
+    # modelConfig.inputs only feeds t2s titles, so only those rows pay for parsing it
+    model_type = resolve_per_key(
+        keys[["modelConfig.id", "modelConfig.name"]],
+        lambda dim: pd.DataFrame(
+            {"model_type": classify_model_types(dim["modelConfig.id"], dim["modelConfig.name"])}
+        ),
+    )["model_type"]
+    keys["inputs_choice"] = None
+    t2s = (model_type == "t2s").to_numpy()
+    if t2s.any():
+        keys.loc[t2s, "inputs_choice"] = (
+            _column(df, "modelConfig.inputs")[t2s].map(_extract_from_inputs).map(_hashable)
+        )
+
+    resolved = resolve_per_key(keys, resolve_model_config)
+    for col in MODEL_DIMENSION_COLUMNS:
+        df[col] = resolved[col]
+    return df.drop(columns=["modelConfig.inputs"], errors="ignore")
+
+
+@timed("transforms.add_quality_and_cost")
 def add_quality_and_cost(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
+    df = df.copy(deep=False)
     df["default_cost"] = pd.to_numeric(
         df.get("modelConfig.costConfig.defaultCost"), errors="coerce"
     )
@@ -130,7 +296,10 @@ def add_quality_and_cost(df: pd.DataFrame) -> pd.DataFrame:
         df["was_downloaded"] = df["resultDownloadedAt"].notna()
     else:
         df["was_downloaded"] = False
-    if "qualityAnalysis.rewrittenPrompt" in df.columns:
+    if "has_rewrite" in df.columns:
+        # Already computed server-side by the slim projection
+        df["has_rewrite"] = df["has_rewrite"].eq(True)
+    elif "qualityAnalysis.rewrittenPrompt" in df.columns:
         df["has_rewrite"] = df["qualityAnalysis.rewrittenPrompt"].notna() & (
             df["qualityAnalysis.rewrittenPrompt"].astype(str).str.len() > 0
         )
@@ -139,28 +308,108 @@ def add_quality_and_cost(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def frame_bytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+
+@timed("transforms.compact_dataframe")
+def compact_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """Apply ``COMPACT_SCHEMA`` to an enriched frame and log the size before and after."""
+    # Deep memory usage walks every string, so only measure when it will be logged
+    report = logger.isEnabledFor(logging.INFO)
+    before = frame_bytes(df) if report else None
+    df = df.drop(columns=[c for c in COMPACT_SCHEMA["drop"] if c in df.columns])
+    for col in COMPACT_SCHEMA["category"]:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    for col in COMPACT_SCHEMA["float32"]:
+        if col in df.columns:
+            df[col] = df[col].astype("float32")
+    for col in COMPACT_SCHEMA["bool"]:
+        if col in df.columns:
+            df[col] = df[col].eq(True)
+    if report:
+        logger.info("Compacted %d rows from %d to %d bytes", len(df), before, frame_bytes(df))
+    return df
+
+
+def union_categories(parts: list):
+    """Union of the categories of categorical ``parts``, or None when none has any.
+
+    An all-missing part (e.g. a delta without any error.code) has empty float64
+    categories; it takes whatever the other parts have.
+    """
+    known = [part for part in parts if len(part.cat.categories)]
+    if not known:
+        return None
+    if len({part.cat.categories.dtype for part in known}) > 1:
+        known = [part.cat.set_categories(part.cat.categories.astype(object)) for part in known]
+    return pd.api.types.union_categoricals(known, ignore_order=True).categories
+
+
+def align_categories(frames: Iterable[pd.DataFrame]) -> list:
+    """Give shared categorical columns one category set so ``pd.concat`` keeps them categorical."""
+    frames = list(frames)
+    shared = set.intersection(*(set(f.columns) for f in frames)) if frames else set()
+    for col in shared:
+        if not all(isinstance(f[col].dtype, pd.CategoricalDtype) for f in frames):
+            continue
+        categories = union_categories([f[col] for f in frames])
+        if categories is None:
+            continue
+        frames = [f.assign(**{col: f[col].cat.set_categories(categories)}) for f in frames]
+    return frames
+
+
+@timed("transforms.enrich_dataframe")
 def enrich_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     df = add_time_columns(df)
     df = add_model_columns(df)
     df = add_quality_and_cost(df)
-    return df
+    return compact_dataframe(df)
+
+
+# One pattern for all FAMILY_RULES. Each rule is a lookahead tried at position 0 in
+# rule order, so the first rule matching anywhere in the title wins (as with one
+# re.search per rule) and its named group tells which family it was.
+_FAMILY_GROUPS = {f"family_{i}": fam for i, (fam, _) in enumerate(FAMILY_RULES)}
+_FAMILY_PATTERN = re.compile(
+    "|".join(
+        f"(?=.*?(?P<{group}>{pattern}))"
+        for group, (_, pattern) in zip(_FAMILY_GROUPS, FAMILY_RULES)
+    ),
+    re.DOTALL,
+)
+
+
+@lru_cache(maxsize=4096)
+def _family_of(title: str) -> str:
+    match = _FAMILY_PATTERN.match(title.lower())
+    return _FAMILY_GROUPS[match.lastgroup] if match else "other"
 
 
 def detect_family(title: str) -> str:
     if not title:
         return "other"
-    s = str(title).lower()
-    for fam, pattern in FAMILY_RULES:
-        if re.search(pattern, s):
-            return fam
-    return "other"
+    return _family_of(str(title))
+
+
+def _hex_to_rgb(hex_color: str):
+    value = hex_color.lstrip("#")
+    if len(value) == 3:
+        value = "".join(c * 2 for c in value)
+    return tuple(int(value[i:i + 2], 16) / 255 for i in (0, 2, 4))
+
+
+def _rgb_to_hex(rgb) -> str:
+    return "#" + "".join(f"{round(min(max(c, 0.0), 1.0) * 255):02x}" for c in rgb)
 
 
 def ramp_around_base(base_hex: str, n: int, light_shift: float = 0.22, dark_shift: float = 0.18):
     if n <= 1:
         return [base_hex]
 
-    h, l, s = colorsys.rgb_to_hls(*to_rgb(base_hex))
+    h, l, s = colorsys.rgb_to_hls(*_hex_to_rgb(base_hex))
     l_light = min(l + light_shift, 0.85)
     l_dark = max(l - dark_shift, 0.15)
     levels = list(np.linspace(l_light, l_dark, n))
@@ -169,22 +418,34 @@ def ramp_around_base(base_hex: str, n: int, light_shift: float = 0.22, dark_shif
     idx = int(min(range(n), key=lambda i: abs(levels[i] - l)))
     levels[idx] = l
 
-    return [to_hex(colorsys.hls_to_rgb(h, li, s)) for li in levels]
+    return [_rgb_to_hex(colorsys.hls_to_rgb(h, li, s)) for li in levels]
 
 
-def build_family_palette(titles: Iterable[str], totals: Dict[str, float] = None) -> Dict[str, str]:
+@lru_cache(maxsize=256)
+def _ranked_palette(ranked: tuple) -> Dict[str, str]:
     family_map = {}
-    for t in titles:
+    for t in ranked:
         family_map.setdefault(detect_family(t), []).append(t)
 
     palette = {}
     for fam, items in family_map.items():
         base = FAMILY_BASE_COLORS.get(fam, FAMILY_BASE_COLORS["other"])
-        if totals is not None:
-            items = sorted(items, key=lambda x: totals.get(x, 0), reverse=True)
-        else:
-            items = sorted(items)
         shades = ramp_around_base(base, len(items))
         for t, c in zip(items, shades):
             palette[t] = c
     return palette
+
+
+def build_family_palette(titles: Iterable[str], totals: Dict[str, float] = None) -> Dict[str, str]:
+    """One shade of its family's base color per title, ranked by ``totals`` (else by name).
+
+    The palette only depends on the title set and its ranking, so charts of one page
+    that color the same titles share a single computation.
+    """
+    titles = list(dict.fromkeys(titles))
+    if totals is not None:
+        ranked = sorted(titles, key=lambda x: totals.get(x, 0), reverse=True)
+    else:
+        ranked = sorted(titles)
+    # Callers may add entries (e.g. "Other"), so never hand out the cached dict
+    return dict(_ranked_palette(tuple(ranked)))
@@ -0,0 +1,131 @@
+import functools
+import json
+import logging
+import os
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Spans recorded for the current script run (None when the debug panel is off)
+_recorder: ContextVar[Optional[list]] = ContextVar("span_recorder", default=None)
+_depth: ContextVar[int] = ContextVar("span_depth", default=0)
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _rss_bytes() -> Optional[int]:
+    # Current (not peak) resident size; only available where /proc exists
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def log_spans():
+    """Emit every finished span as a JSON line on stderr (``LOG_SPANS``)."""
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+
+def enabled() -> bool:
+    # isEnabledFor is cached by logging, so the disabled path is two lookups
+    return _recorder.get() is not None or logger.isEnabledFor(logging.INFO)
+
+
+class _NoSpan:
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Span:
+    """Wall time, row count and RSS delta of one block; set ``rows`` inside the block."""
+
+    def __init__(self, name: str, **fields):
+        self.name = name
+        self.fields = fields
+        self.rows = None
+
+    def __enter__(self):
+        self._token = _depth.set(_depth.get() + 1)
+        self._rss = _rss_bytes()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self._started
+        rss = _rss_bytes()
+        _depth.reset(self._token)
+        record = {
+            "span": self.name,
+            "depth": _depth.get(),
+            "started": self._started,
+            "seconds": round(seconds, 6),
+            "rows": self.rows,
+            "rss_delta_bytes": None if rss is None or self._rss is None else rss - self._rss,
+            "error": None if exc_type is None else exc_type.__name__,
+            **self.fields,
+        }
+        recorder = _recorder.get()
+        if recorder is not None:
+            recorder.append(record)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps(record, default=str))
+        return False
+
+
+def span(name: str, **fields):
+    """Context manager timing a block; a shared no-op when instrumentation is off."""
+    if not enabled():
+        return _NO_SPAN
+    return Span(name, **fields)
+
+
+def timed(name: str):
+    """Decorator form of ``span``; records ``len()`` of a DataFrame result as rows."""
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not enabled():
+                return fn(*args, **kwargs)
+            with Span(name) as s:
+                out = fn(*args, **kwargs)
+                if isinstance(out, pd.DataFrame):
+                    s.rows = len(out)
+                return out
+
+        return wrapper
+
+    return decorate
+
+
+def record_spans(active: bool) -> Optional[List[dict]]:
+    """Start (or stop) collecting spans for the current script run."""
+    records = [] if active else None
+    _recorder.set(records)
+    return records
+
+
+def spans_frame(records: List[dict]) -> pd.DataFrame:
+    columns = ["span", "depth", "started", "seconds", "rows", "rss_delta_bytes", "error"]
+    # Spans are recorded as they finish; order them by start so parents lead
+    df = pd.DataFrame(records, columns=columns).sort_values("started", ignore_index=True)
+    # Indent nested spans so the table reads like a call tree
+    df["span"] = ["· " * depth + name for name, depth in zip(df["span"], df["depth"])]
+    df["rss_delta_mb"] = df["rss_delta_bytes"] / 1e6
+    return df.drop(columns=["depth", "started", "rss_delta_bytes"])
@@ -9,8 +9,17 @@ if str(ROOT) not in sys.path:
 
 st.set_page_config(page_title="🛠️ Task Breakdown", layout="wide")
 
-from st_dashboard.data.loader import load_data
+from st_dashboard.data.cube import top_titles as cube_top_titles
+from st_dashboard.data.loader import (
+    get_task_refresher,
+    load_facets,
+    load_job_details,
+    load_recent_jobs,
+    load_task_slices,
+)
 from st_dashboard.data.constants import MAIN_MODEL_TYPES, DEFAULT_TOP_N
+from st_dashboard.charts.render_cache import get_render_cache
+from st_dashboard.instrumentation import record_spans, span, spans_frame
 from st_dashboard.charts.task_breakdown import (
     usage_over_time,
     cost_over_time,
@@ -22,6 +31,9 @@ from st_dashboard.charts.task_breakdown import (
     scatter_quality_cost,
 )
 
+# Per-stage timings for this run, listed in the sidebar when "Debug timings" is on
+span_records = record_spans(st.session_state.get("debug_spans", False))
+
 logo_path = Path(__file__).resolve().parents[1] / "assets" / "studio-jadu.png"
 if logo_path.exists():
     st.image(str(logo_path), use_container_width=False)
@@ -30,18 +42,18 @@ st.header("Task Breakdown")
 st.caption("Deep dive into a single task type, comparing model usage, cost, and quality signals.")
 
 try:
-    with st.spinner("Loading data..."):
-        df = load_data()
+    with st.spinner("Loading data..."), span("loader.load_facets"):
+        facets = load_facets(group_col="model_type")
 except Exception as exc:
     st.error(f"Failed to load data from MongoDB: {exc}")
     st.stop()
 
-if df.empty:
+if facets.empty:
     st.warning("No data returned from MongoDB.")
     st.stop()
 
-min_date = df["created_at"].min().date()
-max_date = df["created_at"].max().date()
+min_date = facets["min_created"].min().date()
+max_date = facets["max_created"].max().date()
 
 st.sidebar.subheader("Filters")
 start_date, end_date = st.sidebar.date_input(
@@ -51,9 +63,10 @@ start_date, end_date = st.sidebar.date_input(
     max_value=max_date,
 )
 
-model_types = [t for t in MAIN_MODEL_TYPES if t in df["model_type"].unique()]
+available_types = facets["model_type"].dropna().tolist()
+model_types = [t for t in MAIN_MODEL_TYPES if t in available_types]
 if not model_types:
-    model_types = sorted(df["model_type"].dropna().unique().tolist())
+    model_types = sorted(available_types)
 
 default_index = model_types.index("i2i") if "i2i" in model_types else 0
 selected_type = st.sidebar.selectbox("Task", model_types, index=default_index)
@@ -63,67 +76,112 @@ percent = mode == "Percent"
 
 top_n = st.sidebar.slider("Top N models", min_value=3, max_value=12, value=DEFAULT_TOP_N, step=1)
 
-mask = (df["created_at"].dt.date >= start_date) & (df["created_at"].dt.date <= end_date)
-mask &= df["model_type"] == selected_type
+# Only the selected task and date range are read from MongoDB; ranges already
+# loaded for this task are reused.
+try:
+    with st.spinner("Loading data..."):
+        task_version, cells, hist = load_task_slices(selected_type, start_date, end_date)
+except Exception as exc:
+    st.error(f"Failed to load data from MongoDB: {exc}")
+    st.stop()
 
-filtered = df[mask].copy()
+# None when an aggregate server or the change stream (LIVE_INGEST) keeps the data fresh
+refresher = get_task_refresher(selected_type)
+if refresher is not None:
+    refresh_age = refresher.age()
+    if refresh_age is None:
+        st.sidebar.caption(
+            f"Background refresh every {refresher.interval_seconds // 60} min (not run yet)"
+        )
+    else:
+        st.sidebar.caption(
+            f"Data refreshed {refresh_age / 60:.0f} min ago (took {refresher.duration:.1f}s)"
+        )
+    if refresher.last_error is not None:
+        st.sidebar.caption(f"Last refresh failed: {refresher.last_error}")
 
-if filtered.empty:
+if cells.empty:
     st.warning("No data for the selected filters.")
     st.stop()
 
+# Rendered figures are reused while the data version and the chart's inputs are unchanged
+render_cache = get_render_cache()
+render_key = (selected_type, task_version, start_date, end_date)
+
 st.subheader(f"Generation usage over time ({selected_type})")
 st.caption("Weekly job volume for top models within the selected task.")
-fig_usage = usage_over_time(filtered, top_n=top_n, percent=percent)
+with span("chart.usage_over_time"):
+    fig_usage = render_cache.plotly(
+        ("usage_over_time", render_key, top_n, percent),
+        lambda: usage_over_time(cells, top_n=top_n, percent=percent),
+    )
 st.plotly_chart(fig_usage, use_container_width=True)
 
 st.subheader(f"Cost over time ({selected_type})")
 st.caption("Weekly estimated cost for top models within the selected task.")
-fig_cost = cost_over_time(filtered, top_n=top_n, percent=percent)
+with span("chart.cost_over_time"):
+    fig_cost = render_cache.plotly(
+        ("cost_over_time", render_key, top_n, percent),
+        lambda: cost_over_time(cells, top_n=top_n, percent=percent),
+    )
 st.plotly_chart(fig_cost, use_container_width=True)
 
 # Determine top titles for detailed plots
-model_title_counts = filtered["model_title_extracted"].value_counts().head(top_n)
-top_titles = model_title_counts.index.tolist()
+top_titles = cube_top_titles(cells, top_n)
 
 st.subheader("Quality")
 st.caption("Quality score distribution and download rates for the selected task.")
-quality_available = filtered["quality_score"].notna().any()
+quality_available = cells["quality_count"].sum() > 0
 if not quality_available:
     st.info("No quality scores available for this task type.")
 else:
     col_q1, col_q2 = st.columns([1, 1])
-    fig_box = quality_boxplot(filtered, top_titles)
+    with span("chart.quality_boxplot"):
+        png_box = render_cache.matplotlib(
+            ("quality_boxplot", render_key, top_n), lambda: quality_boxplot(hist, top_titles)
+        )
     with col_q1:
-        if fig_box is not None:
-            st.pyplot(fig_box, use_container_width=True)
+        if png_box is not None:
+            st.image(png_box, use_container_width=True)
         else:
             st.info("No boxplot data.")
 
-    fig_kde = quality_kde(filtered, top_titles)
+    with span("chart.quality_kde"):
+        png_kde = render_cache.matplotlib(
+            ("quality_kde", render_key, top_n), lambda: quality_kde(hist, top_titles)
+        )
     with col_q2:
-        if fig_kde is not None:
-            st.pyplot(fig_kde, use_container_width=True)
+        if png_kde is not None:
+            st.image(png_kde, use_container_width=True)
         else:
             st.info("No distribution data.")
 
-    fig_download = download_rate_bar(filtered, top_titles)
-    if fig_download is not None:
-        st.pyplot(fig_download, use_container_width=True)
+    with span("chart.download_rate_bar"):
+        png_download = render_cache.matplotlib(
+            ("download_rate_bar", render_key, top_n), lambda: download_rate_bar(cells, top_titles)
+        )
+    if png_download is not None:
+        st.image(png_download, use_container_width=True)
     else:
         st.info("No download rate data.")
 
 st.subheader("Cost")
 st.caption("Average model cost and weekly cost trends for the selected task.")
 col_c1, col_c2 = st.columns(2)
-fig_avg_cost = avg_cost_bar(filtered, top_titles)
+with span("chart.avg_cost_bar"):
+    fig_avg_cost = render_cache.plotly(
+        ("avg_cost_bar", render_key, top_n), lambda: avg_cost_bar(cells, top_titles)
+    )
 with col_c1:
     if fig_avg_cost is not None:
         st.plotly_chart(fig_avg_cost, use_container_width=True)
     else:
         st.info("No cost bar data.")
 
-fig_weekly_cost = weekly_avg_cost_line(filtered, top_titles)
+with span("chart.weekly_avg_cost_line"):
+    fig_weekly_cost = render_cache.plotly(
+        ("weekly_avg_cost_line", render_key, top_n), lambda: weekly_avg_cost_line(cells, top_titles)
+    )
 with col_c2:
     if fig_weekly_cost is not None:
         st.plotly_chart(fig_weekly_cost, use_container_width=True)
@@ -132,6 +190,30 @@ with col_c2:
 
 st.subheader("Quality vs Cost")
 st.caption("Relationship between quality outcomes and average cost per model.")
-fig_scatter = scatter_quality_cost(filtered, top_titles)
-if fig_scatter is not None:
-    st.pyplot(fig_scatter)
+with span("chart.scatter_quality_cost"):
+    png_scatter = render_cache.matplotlib(
+        ("scatter_quality_cost", render_key, top_n), lambda: scatter_quality_cost(cells, top_titles)
+    )
+if png_scatter is not None:
+    st.image(png_scatter)
+
+st.subheader("Job details")
+st.caption("Prompts, quality reasoning and errors are fetched on demand for recent jobs of one model.")
+detail_title = st.selectbox("Model", top_titles) if top_titles else None
+if detail_title is not None and st.checkbox("Load details for the latest 20 jobs"):
+    try:
+        recent = load_recent_jobs(selected_type, start_date, end_date, detail_title)
+        details = load_job_details(tuple(recent["_id"]))
+    except Exception as exc:
+        st.error(f"Failed to load job details from MongoDB: {exc}")
+    else:
+        st.dataframe(
+            recent.merge(details, on="_id", how="left"),
+            use_container_width=True,
+            hide_index=True,
+        )
+
+st.sidebar.checkbox("Debug timings", key="debug_spans")
+if span_records:
+    with st.sidebar.expander("Debug timings", expanded=True):
+        st.dataframe(spans_frame(span_records), use_container_width=True, hide_index=True)
@@ -0,0 +1,274 @@
+"""Headless report export: every dashboard chart as static files, without Streamlit.
+
+    uv run python -m st_dashboard.report --out reports/2026-w42 --start 2026-10-05
+
+Jobs are read from MongoDB once (through the on-disk snapshot when ``SNAPSHOT_DIR``
+is set), rolled up into the cube and quality histograms, and each task's charts are
+rendered in its own process. Plotly figures are written as HTML and JSON, Matplotlib
+figures as PNG; ``index.html`` links them all and ``manifest.json`` lists them.
+"""
+
+import argparse
+import html
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from st_dashboard.data.constants import DEFAULT_TOP_N, MAIN_MODEL_TYPES
+from st_dashboard.data.cube import build_cube, rollup, slice_cube, top_titles
+from st_dashboard.data.distributions import build_quality_hist
+from st_dashboard.data.ipc import from_ipc, to_ipc
+from st_dashboard.instrumentation import span
+
+OVERVIEW_GROUP_COL = "model_type_agg"
+
+
+def _write_plotly(fig, out_dir: Path, name: str) -> List[str]:
+    fig.write_html(out_dir / f"{name}.html", include_plotlyjs="cdn", full_html=True)
+    (out_dir / f"{name}.json").write_text(fig.to_json())
+    return [f"{name}.html", f"{name}.json"]
+
+
+def _write_matplotlib(fig, out_dir: Path, name: str) -> List[str]:
+    import matplotlib.pyplot as plt
+
+    try:
+        fig.savefig(out_dir / f"{name}.png", format="png", bbox_inches="tight")
+    finally:
+        plt.close(fig)
+    return [f"{name}.png"]
+
+
+def _render(charts, out_dir: Path) -> List[dict]:
+    """Build and write ``(name, kind, build)`` charts; charts with no data are listed as skipped."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    entries = []
+    for name, kind, build in charts:
+        with span(f"chart.{name}"):
+            fig = build()
+        if fig is None:
+            entries.append({"chart": name, "files": []})
+            continue
+        write = _write_plotly if kind == "plotly" else _write_matplotlib
+        entries.append({"chart": name, "files": write(fig, out_dir, name)})
+    return entries
+
+
+def overview_rollup(cube: pd.DataFrame, start_date=None, end_date=None) -> pd.DataFrame:
+    """The Overview page's (week, task group) rollup, taken from the cube."""
+    cells = slice_cube(cube, start_date, end_date)
+    return rollup(cells, ["week_start", OVERVIEW_GROUP_COL])[
+        ["week_start", OVERVIEW_GROUP_COL, "count", "cost"]
+    ]
+
+
+def render_overview(weekly: pd.DataFrame, out_dir: Path) -> List[dict]:
+    from st_dashboard.charts.overview import cost_over_time, jobs_and_cost_bar, requests_over_time
+
+    if weekly.empty:
+        return []
+    group = OVERVIEW_GROUP_COL
+    return _render(
+        [
+            ("requests_over_time", "plotly", lambda: requests_over_time(weekly, group, percent=False)),
+            ("requests_over_time_percent", "plotly", lambda: requests_over_time(weekly, group, percent=True)),
+            ("cost_over_time", "plotly", lambda: cost_over_time(weekly, group, percent=False)),
+            ("cost_over_time_percent", "plotly", lambda: cost_over_time(weekly, group, percent=True)),
+            ("jobs_and_cost_bar", "plotly", lambda: jobs_and_cost_bar(weekly, group)),
+        ],
+        out_dir,
+    )
+
+
+def render_task(cells: pd.DataFrame, hist: pd.DataFrame, out_dir: Path, top_n=DEFAULT_TOP_N) -> List[dict]:
+    """Every Task Breakdown chart for one task's cube cells and quality histogram."""
+    from st_dashboard.charts import task_breakdown as charts
+
+    if cells.empty:
+        return []
+    titles = top_titles(cells, top_n)
+    plots = [
+        ("usage_over_time", "plotly", lambda: charts.usage_over_time(cells, top_n=top_n)),
+        ("usage_over_time_percent", "plotly", lambda: charts.usage_over_time(cells, top_n=top_n, percent=True)),
+        ("cost_over_time", "plotly", lambda: charts.cost_over_time(cells, top_n=top_n)),
+        ("cost_over_time_percent", "plotly", lambda: charts.cost_over_time(cells, top_n=top_n, percent=True)),
+    ]
+    # Same rule as the page: quality plots only when the task has scores
+    if cells["quality_count"].sum() > 0:
+        plots += [
+            ("quality_boxplot", "matplotlib", lambda: charts.quality_boxplot(hist, titles)),
+            ("quality_kde", "matplotlib", lambda: charts.quality_kde(hist, titles)),
+            ("download_rate_bar", "matplotlib", lambda: charts.download_rate_bar(cells, titles)),
+        ]
+    plots += [
+        ("avg_cost_bar", "plotly", lambda: charts.avg_cost_bar(cells, titles)),
+        ("weekly_avg_cost_line", "plotly", lambda: charts.weekly_avg_cost_line(cells, titles)),
+        ("scatter_quality_cost", "matplotlib", lambda: charts.scatter_quality_cost(cells, titles)),
+    ]
+    return _render(plots, out_dir)
+
+
+def _render_task_payload(model_type, cells_payload, hist_payload, out_dir, top_n):
+    entries = render_task(from_ipc(cells_payload), from_ipc(hist_payload), Path(out_dir), top_n)
+    return model_type, entries
+
+
+def render_tasks(cube, hist, out_dir: Path, model_types, start_date=None, end_date=None,
+                 top_n=DEFAULT_TOP_N, workers=1) -> dict:
+    """Render each task into ``out_dir/<task>/``, one process per task when ``workers > 1``.
+
+    Workers receive only their task's cube and histogram slices (Arrow IPC), never the
+    job frame. Matplotlib keeps global figure state, so tasks run in processes rather
+    than threads.
+    """
+    jobs = [
+        (
+            model_type,
+            to_ipc(slice_cube(cube, start_date, end_date, model_type=model_type).reset_index(drop=True)),
+            to_ipc(slice_cube(hist, start_date, end_date, model_type=model_type).reset_index(drop=True)),
+            str(out_dir / model_type),
+            top_n,
+        )
+        for model_type in model_types
+    ]
+    if workers <= 1 or len(jobs) <= 1:
+        return dict(_render_task_payload(*job) for job in jobs)
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(jobs)), mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        return dict(pool.map(_render_task_payload, *zip(*jobs)))
+
+
+def write_index(out_dir: Path, manifest: dict):
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2, default=str))
+    lines = [
+        "<!doctype html>",
+        "<html><head><meta charset='utf-8'><title>Studio Jadu usage report</title></head><body>",
+        "<h1>Studio Jadu usage report</h1>",
+        f"<p>{html.escape(str(manifest['start_date']))} to {html.escape(str(manifest['end_date']))}"
+        f" &middot; {manifest['jobs']} jobs &middot; generated {html.escape(manifest['generated_at'])}</p>",
+    ]
+    sections = [("Overview", "overview", manifest["overview"])]
+    sections += [(f"Task breakdown: {task}", task, entries) for task, entries in manifest["tasks"].items()]
+    for heading, folder, entries in sections:
+        lines.append(f"<h2>{html.escape(heading)}</h2>")
+        if not entries:
+            lines.append("<p>No data.</p>")
+            continue
+        lines.append("<ul>")
+        for entry in entries:
+            links = ", ".join(
+                f"<a href='{folder}/{name}'>{name.rsplit('.', 1)[1]}</a>" for name in entry["files"]
+            )
+            lines.append(f"<li>{html.escape(entry['chart'])}: {links or 'no data'}</li>")
+        lines.append("</ul>")
+    lines.append("</body></html>")
+    (out_dir / "index.html").write_text("\n".join(lines))
+
+
+def load_frame(collection, snapshot_dir=None, **loader_options) -> pd.DataFrame:
+    """The enriched job frame, read the way the dashboard reads it (snapshot + delta)."""
+    from st_dashboard.data.incremental import IncrementalLoader
+    from st_dashboard.data.projections import BASE_PROJECTION
+
+    snapshot = None
+    if snapshot_dir:
+        from st_dashboard.data.snapshot import SnapshotStore, query_key
+
+        snapshot = SnapshotStore(Path(snapshot_dir) / query_key(None))
+    loader = IncrementalLoader(collection, BASE_PROJECTION, snapshot=snapshot, **loader_options)
+    return loader.refresh()
+
+
+def build_report(frame: pd.DataFrame, out_dir: Path, start_date: Optional[date] = None,
+                 end_date: Optional[date] = None, model_types=None, top_n=DEFAULT_TOP_N,
+                 workers=1) -> dict:
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    model_types = list(model_types or MAIN_MODEL_TYPES)
+    with span("report.cube", rows=len(frame)):
+        cube = build_cube(frame)
+        hist = build_quality_hist(frame)
+    if start_date is None and not cube.empty:
+        start_date = cube["dt"].min().date()
+    if end_date is None and not cube.empty:
+        end_date = cube["dt"].max().date()
+
+    manifest = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "start_date": start_date,
+        "end_date": end_date,
+        "jobs": len(frame),
+        "overview": render_overview(overview_rollup(cube, start_date, end_date), out_dir / "overview"),
+        "tasks": render_tasks(cube, hist, out_dir, model_types, start_date, end_date, top_n, workers),
+    }
+    write_index(out_dir, manifest)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export every dashboard chart as static files")
+    parser.add_argument("--out", type=Path, default=Path("reports") / date.today().isoformat())
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="first day (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="last day (YYYY-MM-DD)")
+    parser.add_argument("--tasks", nargs="+", default=MAIN_MODEL_TYPES)
+    parser.add_argument("--top-n", type=int, default=DEFAULT_TOP_N)
+    parser.add_argument("--workers", type=int, default=min(len(MAIN_MODEL_TYPES), os.cpu_count() or 1))
+    args = parser.parse_args(argv)
+
+    # Spawned render workers inherit this; no display is needed for PNG output
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
+    from config.settings import settings
+    from src.mongo.mongo_db_client import get_collection
+
+    if settings.log_spans:
+        from st_dashboard.instrumentation import log_spans
+
+        log_spans()
+
+    started = time.perf_counter()
+    frame = load_frame(
+        get_collection("renderboard", "assetGenJobs"),
+        snapshot_dir=settings.snapshot_dir,
+        shards=settings.fetch_shards,
+        max_time_ms=settings.fetch_shard_timeout_ms,
+        retries=settings.fetch_shard_retries,
+        batch_size=settings.fetch_batch_size,
+        max_bytes=settings.fetch_max_bytes,
+        enrich_workers=settings.enrich_workers,
+        enrich_min_rows=settings.enrich_min_rows,
+    )
+    loaded = time.perf_counter()
+    manifest = build_report(
+        frame,
+        args.out,
+        start_date=args.start,
+        end_date=args.end,
+        model_types=args.tasks,
+        top_n=args.top_n,
+        workers=args.workers,
+    )
+    sections = [manifest["overview"], *manifest["tasks"].values()]
+    charts = sum(1 for entries in sections for entry in entries if entry["files"])
+    print(
+        f"Wrote {charts} charts for {len(frame)} jobs to {args.out} "
+        f"(load {loaded - started:.1f}s, render {time.perf_counter() - loaded:.1f}s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
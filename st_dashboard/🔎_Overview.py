@@ -1,13 +1,16 @@
 import sys
 from pathlib import Path
 
+import pandas as pd
 import streamlit as st
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
 
-from st_dashboard.data.loader import load_data
+from st_dashboard.data.loader import load_facets, load_weekly_rollup
+from st_dashboard.charts.render_cache import get_render_cache
+from st_dashboard.instrumentation import record_spans, span, spans_frame
 from st_dashboard.charts.overview import (
     requests_over_time,
     cost_over_time,
@@ -20,6 +23,9 @@ css_path = Path(__file__).parent / "theme" / "style.css"
 if css_path.exists():
     st.markdown(f"<style>{css_path.read_text()}</style>", unsafe_allow_html=True)
 
+# Per-stage timings for this run, listed in the sidebar when "Debug timings" is on
+span_records = record_spans(st.session_state.get("debug_spans", False))
+
 logo_path = Path(__file__).parent / "assets" / "studio-jadu.png"
 if logo_path.exists():
     st.image(str(logo_path), use_container_width=False)
@@ -27,19 +33,21 @@ if logo_path.exists():
 st.header("Overview")
 st.caption("High-level view of Studio Jadu usage, summarizing model requests and estimated cost trends over time.")
 
+GROUP_COL = "model_type_agg"
+
 try:
-    with st.spinner("Loading data..."):
-        df = load_data()
+    with st.spinner("Loading data..."), span("loader.load_facets"):
+        facets = load_facets(group_col=GROUP_COL)
 except Exception as exc:
     st.error(f"Failed to load data from MongoDB: {exc}")
     st.stop()
 
-if df.empty:
+if facets.empty:
     st.warning("No data returned from MongoDB.")
     st.stop()
 
-min_date = df["created_at"].min().date()
-max_date = df["created_at"].max().date()
+min_date = facets["min_created"].min().date()
+max_date = facets["max_created"].max().date()
 
 st.sidebar.subheader("Filters")
 start_date, end_date = st.sidebar.date_input(
@@ -52,34 +60,61 @@ start_date, end_date = st.sidebar.date_input(
 mode = st.sidebar.radio("Stacked area mode", ["Absolute", "Percent"], index=0)
 percent = mode == "Percent"
 
-model_types = sorted(df["model_type_agg"].dropna().unique().tolist())
+model_types = sorted(facets[GROUP_COL].dropna().unique().tolist())
 selected_types = st.sidebar.multiselect(
     "Model types",
     model_types,
     default=model_types,
 )
 
-mask = (df["created_at"].dt.date >= start_date) & (df["created_at"].dt.date <= end_date)
-if selected_types:
-    mask &= df["model_type_agg"].isin(selected_types)
-
-filtered = df[mask].copy()
+# Weekly (week, task) cells are aggregated in MongoDB; no raw jobs reach this process.
+try:
+    with st.spinner("Loading data..."), span("loader.load_weekly_rollup"):
+        rollup = load_weekly_rollup(
+            group_col=GROUP_COL,
+            start_date=start_date,
+            end_date=end_date,
+            model_types=tuple(selected_types) if selected_types else None,
+        )
+except Exception as exc:
+    st.error(f"Failed to load data from MongoDB: {exc}")
+    st.stop()
 
-if filtered.empty:
+if rollup.empty:
     st.warning("No data for the selected filters.")
     st.stop()
 
+# The rollup's content hash is its data version for the render cache
+render_cache = get_render_cache()
+rollup_version = int(pd.util.hash_pandas_object(rollup, index=False).sum())
+
 st.subheader("Requests over time")
 st.caption("Weekly count of jobs created, grouped by task type.")
-fig_requests = requests_over_time(filtered, group_col="model_type_agg", percent=percent)
+with span("chart.requests_over_time"):
+    fig_requests = render_cache.plotly(
+        ("requests_over_time", rollup_version, percent),
+        lambda: requests_over_time(rollup, group_col=GROUP_COL, percent=percent),
+    )
 st.plotly_chart(fig_requests, use_container_width=True)
 
 st.subheader("Cost over time")
 st.caption("Estimated weekly spend (USD) for generated jobs, grouped by task type.")
-fig_cost = cost_over_time(filtered, group_col="model_type_agg", percent=percent)
+with span("chart.cost_over_time"):
+    fig_cost = render_cache.plotly(
+        ("cost_over_time", rollup_version, percent),
+        lambda: cost_over_time(rollup, group_col=GROUP_COL, percent=percent),
+    )
 st.plotly_chart(fig_cost, use_container_width=True)
 
 st.subheader("Jobs and total cost by model type")
 st.caption("Side-by-side comparison of total job volume and total cost by task type.")
-fig_bar = jobs_and_cost_bar(filtered, group_col="model_type_agg")
+with span("chart.jobs_and_cost_bar"):
+    fig_bar = render_cache.plotly(
+        ("jobs_and_cost_bar", rollup_version), lambda: jobs_and_cost_bar(rollup, group_col=GROUP_COL)
+    )
 st.plotly_chart(fig_bar, use_container_width=True)
+
+st.sidebar.checkbox("Debug timings", key="debug_spans")
+if span_records:
+    with st.sidebar.expander("Debug timings", expanded=True):
+        st.dataframe(spans_frame(span_records), use_container_width=True, hide_index=True)
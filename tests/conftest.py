@@ -0,0 +1,14 @@
+import pytest
+
+from tests.fakes import FakeCollection, make_job
+
+
+@pytest.fixture
+def jobs():
+    # Every fifth job failed, so the initial load has a non-empty error.code category
+    return [make_job(i, error_code="TIMEOUT" if i % 5 == 0 else None) for i in range(60)]
+
+
+@pytest.fixture
+def collection(jobs):
+    return FakeCollection(jobs)
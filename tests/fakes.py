@@ -0,0 +1,197 @@
+"""In-memory stand-ins for the Mongo collection and its job documents."""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+BASE_TIME = datetime(2025, 1, 6, tzinfo=timezone.utc)
+
+
+def _get(doc, path):
+    for part in path.split("."):
+        if not isinstance(doc, dict):
+            return None
+        doc = doc.get(part)
+    return doc
+
+
+def _aware(value):
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _is_type(value, types):
+    types = types if isinstance(types, list) else [types]
+    return ("date" in types and isinstance(value, datetime)) or (
+        "string" in types and isinstance(value, str)
+    )
+
+
+def _matches_op(value, op, arg):
+    value, arg = _aware(value), _aware(arg)
+    if op == "$gte":
+        return value is not None and value >= arg
+    if op == "$gt":
+        return value is not None and value > arg
+    if op == "$lt":
+        return value is not None and value < arg
+    if op == "$in":
+        return value in arg
+    if op == "$ne":
+        return value != arg
+    if op == "$type":
+        return _is_type(value, arg)
+    if op == "$not":
+        return not all(_matches_op(value, inner, inner_arg) for inner, inner_arg in arg.items())
+    if op == "$regex":
+        return False
+    raise NotImplementedError(op)
+
+
+def matches(doc, query) -> bool:
+    """The subset of MongoDB query semantics the loaders use."""
+    for key, cond in query.items():
+        if key == "$and":
+            if not all(matches(doc, part) for part in cond):
+                return False
+        elif key == "$or":
+            if not any(matches(doc, part) for part in cond):
+                return False
+        elif isinstance(cond, dict) and any(op.startswith("$") for op in cond):
+            value = _get(doc, key)
+            for op, arg in cond.items():
+                if op == "$options":
+                    continue
+                if op == "$regex":
+                    flags = re.I if "i" in cond.get("$options", "") else 0
+                    if not (isinstance(value, str) and re.search(arg, value, flags)):
+                        return False
+                elif not _matches_op(value, op, arg):
+                    return False
+        elif _get(doc, key) != cond:
+            return False
+    return True
+
+
+class FakeCursor(list):
+    def batch_size(self, n):
+        return self
+
+    def sort(self, key, direction):
+        return FakeCursor(sorted(self, key=lambda doc: _get(doc, key), reverse=direction == -1))
+
+    def limit(self, n):
+        return FakeCursor(self[:n])
+
+
+class FakeCollection:
+    """In-memory stand-in for ``assetGenJobs``; projections are ignored."""
+
+    def __init__(self, docs=()):
+        self.docs = list(docs)
+        self.queries = []
+
+    def find(self, query=None, projection=None, max_time_ms=None):
+        query = query or {}
+        self.queries.append(query)
+        return FakeCursor(dict(doc) for doc in self.docs if matches(doc, query))
+
+    def upsert(self, doc):
+        self.docs = [d for d in self.docs if d["_id"] != doc["_id"]] + [doc]
+
+
+MODEL_CONFIGS = [
+    ("t2i-flux-dev", "Text to Image", "REPLICATE", "Flux Dev"),
+    ("i2i-nano-banana", "Image to Image", "REPLICATE", "Nano Banana"),
+    ("i2v-kling-2", "Image to Video", "FAL", "Kling 2"),
+    ("t2v-veo3", "Text to Video", "FAL", "Veo 3"),
+]
+
+
+def make_job(i, created=None, updated=None, error_code=None, score=None, model=None):
+    model_id, name, provider, title = MODEL_CONFIGS[i % len(MODEL_CONFIGS) if model is None else model]
+    created = created or BASE_TIME + timedelta(hours=9 * i)
+    doc = {
+        "_id": f"job{i}",
+        "jobId": f"j{i}",
+        "userId": f"u{i % 5}",
+        "createdAt": created,
+        "updatedAt": updated or created,
+        "status": "failed" if error_code else "completed",
+        "resultDownloadedAt": created if i % 2 else None,
+        "qualityAnalysis": {"score": score if score is not None else (i % 10) / 10},
+        "modelConfig": {
+            "id": model_id,
+            "name": name,
+            "provider": provider,
+            "modelTitle": title,
+            "costConfig": {"defaultCost": 1 + i % 3},
+        },
+    }
+    if error_code:
+        doc["error"] = {"code": error_code}
+    return doc
+
+
+class ExpressionError(Exception):
+    """What the server raises for an operator applied to the wrong BSON type."""
+
+
+def _to_string(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (str, int, float)):
+        return str(value)
+    raise ExpressionError(f"cannot convert {type(value).__name__} to string")
+
+
+def evaluate(expr, doc):
+    """The subset of aggregation expression semantics the pipelines use, type errors included."""
+    if isinstance(expr, str) and expr.startswith("$"):
+        return _get(doc, expr[1:])
+    if isinstance(expr, list):
+        return [evaluate(item, doc) for item in expr]
+    if not isinstance(expr, dict):
+        return expr
+    (op, arg), = expr.items()
+    if op == "$convert":
+        value = evaluate(arg["input"], doc)
+        if value is None:
+            return arg.get("onNull")
+        try:
+            return _to_string(value)
+        except ExpressionError:
+            if "onError" in arg:
+                return arg["onError"]
+            raise
+    if op == "$toLower":
+        value = evaluate(arg, doc)
+        return "" if value is None else _to_string(value).lower()
+    if op == "$ifNull":
+        value = evaluate(arg[0], doc)
+        return evaluate(arg[1], doc) if value is None else value
+    if op == "$indexOfCP":
+        value, token = evaluate(arg, doc)
+        if value is None:
+            return None
+        if not isinstance(value, str):
+            raise ExpressionError("$indexOfCP requires a string as the first argument")
+        return value.find(token)
+    if op == "$gte":
+        left, right = evaluate(arg, doc)
+        # BSON order: null sorts before every number
+        return left is not None and left >= right
+    if op == "$or":
+        return any(evaluate(item, doc) for item in arg)
+    if op == "$in":
+        value, options = evaluate(arg, doc)
+        return value in options
+    if op == "$cond":
+        condition, then, otherwise = arg
+        return evaluate(then if evaluate(condition, doc) else otherwise, doc)
+    if op == "$switch":
+        for branch in arg["branches"]:
+            if evaluate(branch["case"], doc):
+                return evaluate(branch["then"], doc)
+        return evaluate(arg["default"], doc)
+    raise NotImplementedError(op)
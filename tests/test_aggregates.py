@@ -0,0 +1,42 @@
+import pytest
+
+from st_dashboard.data.aggregates import model_type_expr
+from st_dashboard.data.transforms import classify_model_type
+from tests.fakes import ExpressionError, evaluate
+from tests.test_transforms import MODEL_IDS, MODEL_NAMES
+
+ODD_VALUES = [42, 3.5, True, {"nested": "t2i"}, ["i2v"]]
+
+
+def _doc(model_id, model_name):
+    config = {}
+    if model_id is not None:
+        config["id"] = model_id
+    if model_name is not None:
+        config["name"] = model_name
+    return {"modelConfig": config}
+
+
+@pytest.mark.parametrize("model_id", MODEL_IDS)
+@pytest.mark.parametrize("model_name", MODEL_NAMES)
+def test_model_type_expr_matches_python_rules(model_id, model_name):
+    expected = classify_model_type(model_id, model_name)
+    assert evaluate(model_type_expr(), _doc(model_id, model_name)) == expected
+
+
+@pytest.mark.parametrize("odd", ODD_VALUES)
+def test_model_type_expr_survives_non_string_fields(odd):
+    assert evaluate(model_type_expr(), _doc(odd, "Image to Video")) == "i2v"
+    assert evaluate(model_type_expr(), _doc("t2v-veo3", odd)) == "t2v"
+    assert evaluate(model_type_expr(), _doc(odd, odd)) == "unknown"
+
+
+def test_numeric_name_matches_python_rules():
+    # A number is matched on its text on both sides
+    assert evaluate(model_type_expr(), _doc("i2i-x", 7)) == classify_model_type("i2i-x", 7) == "i2i"
+
+
+def test_unconverted_name_fails_the_aggregation():
+    raw_name = {"$gte": [{"$indexOfCP": ["$modelConfig.name", "Text"]}, 0]}
+    with pytest.raises(ExpressionError):
+        evaluate(raw_name, _doc("x", 42))
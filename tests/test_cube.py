@@ -0,0 +1,47 @@
+from datetime import date
+
+import pytest
+
+from st_dashboard.data.cube import build_cube, rollup, slice_cube
+from st_dashboard.data.decode import decode_cursor
+from st_dashboard.data.parallel import enrich_frame
+from st_dashboard.data.projections import BASE_PROJECTION
+from st_dashboard.report import overview_rollup
+from tests.fakes import make_job
+
+
+def _untitled(i, model_id, name):
+    job = make_job(i)
+    job["modelConfig"].update(id=model_id, name=name, modelTitle=None)
+    return job
+
+
+@pytest.fixture
+def frame(jobs):
+    docs = jobs + [
+        _untitled(100, "i2v-custom", "Image to Video"),
+        _untitled(101, "mystery", "Something else"),
+    ]
+    return enrich_frame(decode_cursor(docs, BASE_PROJECTION))
+
+
+def test_cube_totals_match_the_frame(frame):
+    assert frame["model_title_extracted"].isna().any()
+    cube = build_cube(frame)
+    assert cube["count"].sum() == len(frame)
+    assert cube["cost_sum"].sum() == pytest.approx(frame["default_cost"].astype(float).sum())
+    assert cube["downloaded"].sum() == frame["was_downloaded"].sum()
+
+
+def test_overview_rollup_keeps_untitled_and_unknown_jobs(frame):
+    weekly = overview_rollup(build_cube(frame))
+    assert weekly["count"].sum() == len(frame)
+    assert weekly["cost"].sum() == pytest.approx(frame["default_cost"].astype(float).sum())
+    assert "other" in set(weekly["model_type_agg"])
+
+
+def test_task_slice_counts_untitled_jobs():
+    docs = [make_job(2), _untitled(6, "i2v-custom", "Image to Video"), _untitled(7, "x", "y")]
+    cube = build_cube(enrich_frame(decode_cursor(docs, BASE_PROJECTION)))
+    cells = slice_cube(cube, date(2025, 1, 1), date(2025, 12, 31), model_type="i2v")
+    assert rollup(cells, ["model_type"])["count"].tolist() == [2]
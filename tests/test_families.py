@@ -0,0 +1,80 @@
+import re
+
+import numpy as np
+import pytest
+
+from st_dashboard.data.constants import FAMILY_BASE_COLORS, FAMILY_RULES
+from st_dashboard.data.transforms import build_family_palette, detect_family, ramp_around_base
+
+# Fragments that hit one or several FAMILY_RULES, plus filler that hits none
+FRAGMENTS = [
+    "nano banana", "nanobanan", "nano-banana", "gpt image 1", "gpt-image-1", "gptimage",
+    "flux", "kling", "veo", "seedance", "runway", "eleven", "imagen", "seedream", "hailuo",
+    "FLUX", "Kling", "pro", "v2", "1.1", "ultra", "fast", "-", " ", "",
+]
+
+
+def _per_rule_family(title):
+    """detect_family as it was: one re.search per rule, first match wins."""
+    if not title:
+        return "other"
+    s = str(title).lower()
+    for fam, pattern in FAMILY_RULES:
+        if re.search(pattern, s):
+            return fam
+    return "other"
+
+
+def _per_family_palette(titles, totals=None):
+    """build_family_palette as it was: titles grouped by family, then ranked per family."""
+    family_map = {}
+    for t in titles:
+        family_map.setdefault(_per_rule_family(t), []).append(t)
+    palette = {}
+    for fam, items in family_map.items():
+        base = FAMILY_BASE_COLORS.get(fam, FAMILY_BASE_COLORS["other"])
+        if totals is not None:
+            items = sorted(items, key=lambda x: totals.get(x, 0), reverse=True)
+        else:
+            items = sorted(items)
+        for t, c in zip(items, ramp_around_base(base, len(items))):
+            palette[t] = c
+    return palette
+
+
+def _random_titles(rng, n):
+    picks = rng.integers(0, len(FRAGMENTS), size=(n, 3))
+    return [" ".join(FRAGMENTS[i] for i in row).strip() for row in picks]
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(25)
+
+
+def test_detect_family_matches_per_rule_search(rng):
+    titles = _random_titles(rng, 5000) + ["veo flux", "Kling × Nano Banana", "x\nflux", None, 0]
+    for title in titles:
+        assert detect_family(title) == _per_rule_family(title), title
+
+
+def test_random_titles_cover_every_rule(rng):
+    families = {detect_family(title) for title in _random_titles(rng, 5000)}
+    assert families == {fam for fam, _ in FAMILY_RULES} | {"other"}
+
+
+@pytest.mark.parametrize("with_totals", [True, False])
+def test_build_family_palette_matches_per_family_ranking(rng, with_totals):
+    for _ in range(200):
+        titles = list(dict.fromkeys(_random_titles(rng, int(rng.integers(1, 15)))))
+        totals = None
+        if with_totals:
+            # Few distinct values, so ties exercise the stable ordering
+            totals = {t: float(rng.integers(0, 4)) for t in titles if rng.random() < 0.9}
+        assert build_family_palette(titles, totals) == _per_family_palette(titles, totals)
+
+
+def test_build_family_palette_hands_out_copies():
+    palette = build_family_palette(["Flux Dev", "Kling 2"])
+    palette["Other"] = "#000000"
+    assert "Other" not in build_family_palette(["Flux Dev", "Kling 2"])
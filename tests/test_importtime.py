@@ -0,0 +1,14 @@
+import pytest
+
+from benchmarks.importtime import BUDGET_MS, FORBIDDEN, PAGES, check_page
+
+
+@pytest.mark.parametrize("page", PAGES, ids=lambda path: path.stem)
+def test_page_imports_stay_within_budget(page, monkeypatch):
+    # Dummy credentials: importing a page must not need (or connect to) MongoDB
+    for name in ("MONGO_USER", "MONGO_PASSWORD", "MONGO_HOST"):
+        monkeypatch.setenv(name, "dummy")
+    result = check_page(page)
+    loaded = [name for name in FORBIDDEN if name in result["modules"]]
+    assert not loaded, f"{page.name} imports {loaded} at page import"
+    assert result["total_ms"] <= BUDGET_MS, f"{page.name}: {result['heaviest']}"
@@ -0,0 +1,75 @@
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+
+from st_dashboard.data.incremental import IncrementalLoader
+from st_dashboard.data.projections import BASE_PROJECTION
+from st_dashboard.data.transforms import align_categories
+from tests.fakes import BASE_TIME, make_job
+
+
+def _loader(collection, **kwargs):
+    return IncrementalLoader(collection, BASE_PROJECTION, shards=1, **kwargs)
+
+
+def test_align_categories_with_all_missing_part():
+    known = pd.DataFrame({"code": pd.Series(["TIMEOUT", None], dtype="category")})
+    missing = pd.DataFrame({"code": pd.Series([None, None], dtype="category")})
+    merged = pd.concat(align_categories([known, missing]), ignore_index=True)
+    assert isinstance(merged["code"].dtype, pd.CategoricalDtype)
+    assert merged["code"].tolist()[:1] == ["TIMEOUT"]
+    assert merged["code"].isna().sum() == 3
+
+
+def test_refresh_with_error_free_delta(collection):
+    loader = _loader(collection)
+    first = loader.refresh()
+    assert len(first) == 60
+    assert first["error.code"].notna().any()
+
+    # One completed job updated: the delta has no error.code at all
+    later = BASE_TIME + timedelta(days=60)
+    collection.upsert(make_job(3, updated=later, score=0.95))
+    frame = loader.refresh()
+
+    assert len(frame) == 60
+    assert loader.version == 2
+    assert frame.loc[frame["_id"] == "job3", "quality_score"].item() == pytest.approx(0.95)
+    assert isinstance(frame["error.code"].dtype, pd.CategoricalDtype)
+    assert (frame["error.code"] == "TIMEOUT").sum() == 12
+
+
+def test_refresh_appends_new_jobs(collection):
+    loader = _loader(collection)
+    loader.refresh()
+    collection.upsert(make_job(100, created=BASE_TIME + timedelta(days=70)))
+    frame = loader.refresh()
+    assert len(frame) == 61
+    assert frame["created_at"].is_monotonic_increasing
+
+
+def test_snapshot_restore_then_error_free_delta(collection, tmp_path):
+    from st_dashboard.data.snapshot import SnapshotStore
+
+    _loader(collection, snapshot=SnapshotStore(tmp_path)).refresh()
+
+    collection.upsert(make_job(4, updated=BASE_TIME + timedelta(days=60)))
+    restarted = _loader(collection, snapshot=SnapshotStore(tmp_path))
+    frame = restarted.refresh()
+
+    assert len(frame) == 60
+    assert "updatedAt" in collection.queries[-1]  # only the tail was read
+    assert (frame["error.code"] == "TIMEOUT").sum() == 12
+
+
+def test_concat_decoded_with_an_all_missing_categorical_batch():
+    from st_dashboard.data.decode import concat_decoded, decode_cursor
+
+    with_error = [make_job(0, error_code="TIMEOUT"), make_job(1)]
+    without_error = [make_job(2), make_job(3)]
+    frames = [decode_cursor(docs, BASE_PROJECTION) for docs in (with_error, without_error)]
+    merged = concat_decoded(frames, BASE_PROJECTION)
+    assert isinstance(merged["error.code"].dtype, pd.CategoricalDtype)
+    assert merged["error.code"].tolist()[0] == "TIMEOUT"
+    assert merged["error.code"].isna().sum() == 3
@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+
+import pytest
+
+from st_dashboard.data.live import ChangeStreamIngestor
+from st_dashboard.data.projections import BASE_PROJECTION
+from st_dashboard.data.pushdown import RangeLoader
+from tests.fakes import BASE_TIME, make_job
+
+
+def _event(n, doc):
+    return {"_id": {"_data": f"token{n}"}, "operationType": "update", "fullDocument": doc}
+
+
+def _ingestor(events, *loaders):
+    ingestor = ChangeStreamIngestor(lambda resume_after=None: iter(events), BASE_PROJECTION)
+    for loader in loaders:
+        ingestor.attach(loader)
+    return ingestor
+
+
+def _loaded(collection, model_type):
+    loader = RangeLoader(collection, BASE_PROJECTION, model_type, shards=1)
+    loader.ensure(date(2025, 1, 6), date(2025, 1, 20))
+    return loader
+
+
+def test_batch_is_routed_to_the_touched_task_once(collection):
+    i2i, t2i = _loaded(collection, "i2i"), _loaded(collection, "t2i")
+    later = BASE_TIME + timedelta(days=60)
+    # job1 and job5 are i2i jobs inside the loaded range
+    events = [
+        _event(1, make_job(1, updated=later, score=0.91)),
+        _event(2, make_job(5, updated=later, score=0.92)),
+        _event(3, make_job(1, updated=later + timedelta(seconds=1), score=0.93)),
+    ]
+    ingestor = _ingestor(events, i2i, t2i)
+
+    assert ingestor.run_once() == 3
+    frame, version = i2i.published
+    assert version == 2  # one rebuild for the whole batch
+    scores = frame.set_index("_id")["quality_score"]
+    assert scores["job1"] == pytest.approx(0.93)
+    assert scores["job5"] == pytest.approx(0.92)
+    assert t2i.published[1] == 1
+    # Both loaders have seen every change up to this batch
+    assert i2i.refreshed_at is not None and t2i.refreshed_at is not None
+    assert ingestor.resume_token == {"_data": "token3"}
+
+
+def test_jobs_outside_covered_ranges_are_left_for_the_range_read(collection):
+    i2i = _loaded(collection, "i2i")
+    outside = make_job(201, created=BASE_TIME + timedelta(days=90), model=1)
+    inside = make_job(205, created=BASE_TIME + timedelta(days=2), model=1)
+    _ingestor([_event(1, outside), _event(2, inside)], i2i).run_once()
+
+    frame, version = i2i.published
+    assert version == 2
+    assert "job205" in set(frame["_id"])
+    assert "job201" not in set(frame["_id"])
+
+
+def test_restored_loader_catches_up_on_the_ingestor_thread(collection, tmp_path):
+    from st_dashboard.data.snapshot import SnapshotStore
+
+    before = RangeLoader(collection, BASE_PROJECTION, "i2i", shards=1, snapshot=SnapshotStore(tmp_path))
+    before.ensure(date(2025, 1, 6), date(2025, 1, 20))
+
+    # Written while the process was down: no event will ever carry it
+    collection.upsert(make_job(1, updated=BASE_TIME + timedelta(days=60), score=0.97))
+    restarted = RangeLoader(collection, BASE_PROJECTION, "i2i", shards=1, snapshot=SnapshotStore(tmp_path))
+    ingestor = _ingestor([], restarted)
+    assert ingestor.run_once() == 0
+
+    frame, _ = restarted.published
+    assert frame.set_index("_id")["quality_score"]["job1"] == pytest.approx(0.97)
+    assert restarted.covered == before.covered
@@ -0,0 +1,38 @@
+from datetime import date, timedelta
+
+import pytest
+import streamlit as st
+
+from st_dashboard.data import loader
+from st_dashboard.data.projections import BASE_PROJECTION
+from st_dashboard.data.pushdown import RangeLoader
+from tests.fakes import BASE_TIME, make_job
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    st.cache_resource.clear()
+    yield
+    st.cache_resource.clear()
+
+
+def test_task_aggregates_follow_the_frame_they_are_given(collection):
+    task = RangeLoader(collection, BASE_PROJECTION, "i2i", shards=1)
+    frame, version = task.ensure(date(2025, 1, 6), date(2025, 1, 31))
+    cube = loader.load_task_cube("i2i", frame, version)
+    assert loader.load_task_cube("i2i", frame, version) is cube
+    assert cube["count"].sum() == len(frame)
+
+    later = BASE_TIME + timedelta(days=60)
+    collection.upsert(make_job(400, created=BASE_TIME + timedelta(days=1), updated=later, model=1))
+    task.refresh()
+    newer, newer_version = task.published
+    assert newer_version == version + 1
+
+    newer_cube = loader.load_task_cube("i2i", newer, newer_version)
+    assert newer_cube["count"].sum() == len(frame) + 1
+    # Only the newest version is held on to
+    assert loader._task_derived()._latest[("i2i", "cube")] == (newer_version, newer_cube)
+
+    index = loader.load_task_index("i2i", newer, newer_version)
+    assert len(index.select(date(2025, 1, 6), date(2025, 1, 31))) == len(newer)
@@ -0,0 +1,94 @@
+import threading
+from datetime import date, timedelta
+
+from st_dashboard.data.projections import BASE_PROJECTION
+from st_dashboard.data.pushdown import RangeLoader
+from tests.fakes import BASE_TIME, FakeCollection, make_job
+
+
+class GatedCollection(FakeCollection):
+    """Holds every ``find`` issued while the gate is closed until it is opened."""
+
+    def __init__(self, docs):
+        super().__init__(docs)
+        self.gate = threading.Event()
+        self.gate.set()
+        self.waiting = threading.Event()
+
+    def find(self, query=None, projection=None, max_time_ms=None):
+        if not self.gate.is_set():
+            self.waiting.set()
+            self.gate.wait(5)
+        return super().find(query, projection, max_time_ms)
+
+
+def _loader(collection, **kwargs):
+    return RangeLoader(collection, BASE_PROJECTION, "i2i", shards=1, **kwargs)
+
+
+def test_ensure_reads_only_missing_ranges(collection):
+    loader = _loader(collection)
+    frame, version = loader.ensure(date(2025, 1, 6), date(2025, 1, 12))
+    assert version == 1
+    assert set(frame["model_type"]) == {"i2i"}
+    reads = len(collection.queries)
+
+    # Inside the covered range: served from memory
+    assert loader.ensure(date(2025, 1, 7), date(2025, 1, 10))[1] == version
+    assert len(collection.queries) == reads
+
+    wider, _ = loader.ensure(date(2025, 1, 6), date(2025, 1, 31))
+    assert len(wider) > len(frame)
+    assert len(collection.queries) == reads + 1
+
+
+def test_covered_reads_do_not_wait_for_refresh(jobs):
+    collection = GatedCollection(jobs)
+    loader = _loader(collection)
+    frame, version = loader.ensure(date(2025, 1, 6), date(2025, 1, 31))
+
+    collection.upsert(make_job(1, updated=BASE_TIME + timedelta(days=60), score=0.95))
+    collection.gate.clear()
+    refresh = threading.Thread(target=loader.refresh)
+    refresh.start()
+    assert collection.waiting.wait(5)
+
+    # The refresh is parked inside find() with the writer lock held
+    served, served_version = loader.ensure(date(2025, 1, 6), date(2025, 1, 20))
+    assert served is frame and served_version == version
+
+    collection.gate.set()
+    refresh.join(5)
+    refreshed, refreshed_version = loader.published
+    assert refreshed_version == version + 1
+    assert refreshed.loc[refreshed["_id"] == "job1", "quality_score"].item() > 0.9
+
+
+def test_covered_reads_never_query_mongo(collection):
+    loader = _loader(collection)
+    loader.ensure(date(2025, 1, 6), date(2025, 1, 31))
+    loader.refreshed_at = 0.0  # long out of date
+    reads = len(collection.queries)
+    loader.ensure(date(2025, 1, 6), date(2025, 1, 20))
+    assert len(collection.queries) == reads
+
+
+def test_snapshot_restores_covered_ranges_without_rereading(collection, tmp_path):
+    from st_dashboard.data.snapshot import SnapshotStore
+
+    first = _loader(collection, snapshot=SnapshotStore(tmp_path))
+    frame, _ = first.ensure(date(2025, 1, 6), date(2025, 1, 20))
+    first.ensure(date(2025, 1, 25), date(2025, 1, 31))
+
+    collection.queries.clear()
+    restarted = _loader(collection, snapshot=SnapshotStore(tmp_path))
+    restored, _ = restarted.ensure(date(2025, 1, 8), date(2025, 1, 15))
+    assert collection.queries == []
+    assert restarted.covered == first.covered
+    assert sorted(restored["_id"]) == sorted(first.frame["_id"])
+
+    # The restart catches up from the saved watermark, over the covered ranges only
+    collection.upsert(make_job(1, updated=BASE_TIME + timedelta(days=60), score=0.95))
+    refreshed = restarted.refresh()
+    assert len(collection.queries) == 1 and "updatedAt" in str(collection.queries[0])
+    assert refreshed.loc[refreshed["_id"] == "job1", "quality_score"].item() > 0.9
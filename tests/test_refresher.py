@@ -0,0 +1,69 @@
+import threading
+import time
+
+from st_dashboard.data.refresher import BackgroundRefresher, StaleCache
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_refresher_runs_once_at_start():
+    calls = []
+    refresher = BackgroundRefresher(lambda: calls.append(1) or len(calls), 3600).start()
+    try:
+        assert _wait_for(lambda: refresher.age() is not None)
+        assert refresher.get() == 1
+        assert len(calls) == 1
+    finally:
+        refresher.stop()
+
+
+def test_stale_cache_serves_expired_value_while_rebuilding():
+    release = threading.Event()
+    builds = []
+
+    def build(key):
+        builds.append(key)
+        if len(builds) > 1:
+            release.wait(5)
+        return f"{key}:{len(builds)}"
+
+    cache = StaleCache(build, ttl_seconds=0)
+    assert cache.get("a") == "a:1"
+    # Expired: the stale value comes back at once and one rebuild starts
+    assert cache.get("a") == "a:1"
+    assert cache.get("a") == "a:1"
+    release.set()
+    assert _wait_for(lambda: cache.get("a") == "a:2")
+    assert builds.count("a") >= 2
+
+
+def test_stale_cache_keeps_value_when_rebuild_fails():
+    state = {"fail": False}
+
+    def build(key):
+        if state["fail"]:
+            raise RuntimeError("mongo down")
+        return key * 2
+
+    cache = StaleCache(build, ttl_seconds=0)
+    assert cache.get(3) == 6
+    state["fail"] = True
+    assert cache.get(3) == 6
+    assert _wait_for(lambda: not cache._pending)
+    assert cache.get(3) == 6
+
+
+def test_stale_cache_evicts_least_recently_read():
+    cache = StaleCache(lambda key: key, ttl_seconds=60, max_entries=2)
+    cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")
+    assert list(cache._entries) == [("a",), ("c",)]
@@ -0,0 +1,77 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import plotly.graph_objects as go  # noqa: E402
+
+from st_dashboard.charts.render_cache import RenderCache  # noqa: E402
+
+
+class Builds:
+    """``build`` callable that counts its calls."""
+
+    def __init__(self, make):
+        self.make = make
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.make()
+
+
+def _payload(cache, key, size):
+    return cache._get_or_build(key, lambda: size, lambda n: b"x" * n)
+
+
+def test_evicts_least_recently_used_within_byte_budget():
+    cache = RenderCache(max_bytes=100)
+    _payload(cache, "a", 40)
+    _payload(cache, "b", 40)
+    _payload(cache, "a", 40)  # hit: "a" becomes most recent
+    _payload(cache, "c", 40)
+    assert list(cache._entries) == ["a", "c"]
+    assert cache.size == 80
+
+
+def test_payload_over_budget_is_not_cached():
+    cache = RenderCache(max_bytes=10)
+    assert _payload(cache, "big", 50) == b"x" * 50
+    assert len(cache) == 0
+
+
+def test_plotly_is_built_once_per_key():
+    cache = RenderCache(max_bytes=1 << 20)
+    build = Builds(lambda: go.Figure(go.Bar(x=["a"], y=[1])))
+    first = cache.plotly(("chart", 1), build)
+    second = cache.plotly(("chart", 1), build)
+    assert build.calls == 1
+    assert first.to_dict() == second.to_dict()
+    cache.plotly(("chart", 2), build)
+    assert build.calls == 2
+
+
+def test_none_passes_through_and_is_cached():
+    cache = RenderCache(max_bytes=1 << 20)
+    build = Builds(lambda: None)
+    assert cache.plotly("empty", build) is None
+    assert cache.plotly("empty", build) is None
+    assert cache.matplotlib("empty", build) is None
+    assert build.calls == 2  # once per chart kind
+
+
+def test_matplotlib_figure_is_closed_after_rendering():
+    cache = RenderCache(max_bytes=1 << 20)
+    figures = []
+
+    def build():
+        fig, ax = plt.subplots()
+        ax.plot([0, 1], [1, 0])
+        figures.append(fig)
+        return fig
+
+    png = cache.matplotlib("line", build)
+    assert png.startswith(b"\x89PNG")
+    assert not plt.fignum_exists(figures[0].number)
+    assert cache.matplotlib("line", build) == png
+    assert len(figures) == 1
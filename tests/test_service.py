@@ -0,0 +1,39 @@
+import threading
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from st_dashboard.data.ipc import from_ipc_frames, to_ipc_frames
+from st_dashboard.data.service import AggregateClient, AggregateService, make_server
+
+
+@pytest.fixture
+def client(collection):
+    service = AggregateService(collection, refresh_seconds=3600, shards=1)
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    yield service, AggregateClient(f"http://{host}:{port}", timeout=10)
+    server.shutdown()
+    server.server_close()
+
+
+def test_ipc_frames_round_trip():
+    frames = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"b": ["x"]}), pd.DataFrame()]
+    restored = from_ipc_frames(to_ipc_frames(frames))
+    assert len(restored) == 3
+    pd.testing.assert_frame_equal(restored[0], frames[0])
+    pd.testing.assert_frame_equal(restored[1], frames[1])
+
+
+def test_task_slices_come_from_one_version(client):
+    service, remote = client
+    start, end = date(2025, 1, 6), date(2025, 1, 31)
+    version, cells, hist = remote.task_slices("i2i", start, end)
+
+    expected_version, expected_cells, expected_hist = service.task_slices("i2i", start, end)
+    assert version == expected_version
+    assert cells["count"].sum() == expected_cells["count"].sum() == 15
+    assert len(hist) == len(expected_hist)
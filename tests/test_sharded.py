@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+
+from st_dashboard.data.decode import ByteBudget, MemoryCeilingExceeded, decode_cursor
+from st_dashboard.data.projections import BASE_PROJECTION
+from st_dashboard.data.sharded import fetch_sharded
+from tests.fakes import FakeCollection, FakeCursor, make_job
+
+
+class CountingCollection(FakeCollection):
+    """Counts the documents the decoder pulls from its (batched) cursors."""
+
+    def __init__(self, docs):
+        super().__init__(docs)
+        self.served = 0
+
+    def find(self, query=None, projection=None, max_time_ms=None):
+        docs = super().find(query, projection, max_time_ms)
+        collection = self
+
+        class Cursor(FakeCursor):
+            def batch_size(self, n):
+                return collection._counted(self)
+
+        return Cursor(docs)
+
+    def _counted(self, docs):
+        for doc in docs:
+            self.served += 1
+            yield doc
+
+
+@pytest.fixture
+def many_jobs():
+    return [make_job(i) for i in range(400)]
+
+
+def _decoded_bytes(docs):
+    df = decode_cursor(iter(docs), BASE_PROJECTION, batch_size=10)
+    return int(df.memory_usage(deep=True).sum())
+
+
+def test_sharded_read_matches_single_cursor(many_jobs):
+    collection = FakeCollection(many_jobs)
+    single = fetch_sharded(collection, {}, BASE_PROJECTION, shards=1)
+    sharded = fetch_sharded(collection, {}, BASE_PROJECTION, shards=4, batch_size=10)
+    key = ["_id"]
+    pd.testing.assert_frame_equal(
+        sharded.sort_values(key).reset_index(drop=True),
+        single.sort_values(key).reset_index(drop=True),
+    )
+
+
+def test_byte_ceiling_is_shared_across_shards(many_jobs):
+    collection = CountingCollection(many_jobs)
+    ceiling = int(_decoded_bytes(many_jobs) * 0.3)
+    with pytest.raises(MemoryCeilingExceeded):
+        fetch_sharded(collection, {}, BASE_PROJECTION, shards=4, batch_size=10, max_bytes=ceiling)
+    # Each shard alone is under the ceiling; only a shared budget stops them early
+    assert collection.served < len(many_jobs) * 0.6
+
+
+def test_byte_budget_release_after_failed_attempt():
+    budget = ByteBudget(100)
+    budget.charge(80)
+    budget.release(80)
+    budget.charge(90)
+    with pytest.raises(MemoryCeilingExceeded):
+        budget.charge(20)
+    assert budget.exceeded
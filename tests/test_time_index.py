@@ -0,0 +1,46 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from st_dashboard.data.time_index import TimeIndex, sort_by_created
+
+
+@pytest.fixture
+def index():
+    created = pd.to_datetime(
+        ["2025-01-03 10:00", None, "2025-01-01 00:00", "2025-01-02 23:59", None, "2025-01-05 08:00"],
+        utc=True,
+    )
+    return TimeIndex(pd.DataFrame({"created_at": created, "row": range(6)}))
+
+
+def test_sort_puts_nat_first(index):
+    assert index.df["created_at"].isna().tolist()[:2] == [True, True]
+    assert sort_by_created(index.df) is index.df
+
+
+def test_closed_range_is_inclusive_by_day(index):
+    rows = index.select(date(2025, 1, 2), date(2025, 1, 3))
+    assert rows["row"].tolist() == [3, 0]
+
+
+def test_open_start_skips_nat_rows(index):
+    lo, hi = index.bounds(None, date(2025, 1, 2))
+    assert (lo, hi) == (2, 4)
+    assert index.select(None, date(2025, 1, 2))["row"].tolist() == [2, 3]
+
+
+def test_open_end_runs_to_the_last_row(index):
+    assert index.select(date(2025, 1, 3), None)["row"].tolist() == [0, 5]
+
+
+def test_fully_open_range_is_every_dated_row(index):
+    assert len(index.select()) == 4
+
+
+def test_empty_and_inverted_ranges(index):
+    assert index.select(date(2025, 2, 1), date(2025, 2, 3)).empty
+    lo, hi = index.bounds(date(2025, 1, 5), date(2025, 1, 1))
+    assert lo == hi
+    assert TimeIndex(pd.DataFrame()).select(date(2025, 1, 1), None).empty
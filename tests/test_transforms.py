@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from st_dashboard.data.transforms import (
+    classify_model_type,
+    classify_model_types,
+    extract_model_title,
+    extract_model_titles,
+)
+
+MODEL_IDS = [
+    "t2i-flux-dev",
+    "T2I-Imagen-4",
+    "i2i-nano-banana",
+    "i2i-gpt-image-1",
+    "I2V-kling-2.1",
+    "v2v-runway",
+    "t2v-veo3",
+    "t2s-eleven",
+    "s2v-avatar",
+    "custom-model",
+    "",
+    None,
+    42,
+]
+MODEL_NAMES = [
+    "Text to Image",
+    "Image to Image",
+    "Image to Video",
+    "Video to Video",
+    "Text to Video",
+    "Text to Speech",
+    "Speech to Video",
+    "Minimatics",
+    "Character Models",
+    "Sound Effects",
+    "Something else",
+    "",
+    None,
+]
+
+
+@pytest.fixture
+def configs():
+    rng = np.random.default_rng(7)
+    n = 400
+    return pd.DataFrame(
+        {
+            "modelConfig.id": rng.choice(np.array(MODEL_IDS, dtype=object), n),
+            "modelConfig.name": rng.choice(np.array(MODEL_NAMES, dtype=object), n),
+            "modelConfig.provider": rng.choice(
+                np.array(["OPENAI", "replicate", "FAL", None, np.nan], dtype=object), n
+            ),
+            "modelConfig.modelTitle": rng.choice(
+                np.array(["Flux Dev", "Kling 2.1", "", None, np.nan], dtype=object), n
+            ),
+            "modelConfig.modelMetaData.openAIModelId": rng.choice(
+                np.array(["gpt-image-1", "", None, np.nan], dtype=object), n
+            ),
+            "modelConfig.inputs": rng.choice(
+                np.array(
+                    [
+                        {"tts_model": "eleven_v3"},
+                        {"voice_model": "eleven_v2"},
+                        [{"id": "tts_model", "value": None, "defaultValue": "eleven_v2"}],
+                        [{"id": "speed", "value": 1}],
+                        None,
+                    ],
+                    dtype=object,
+                ),
+                n,
+            ),
+        }
+    )
+
+
+def _row_wise_types(df):
+    return df.apply(
+        lambda row: classify_model_type(row["modelConfig.id"], row["modelConfig.name"]), axis=1
+    )
+
+
+def test_classify_model_types_matches_row_wise(configs):
+    expected = _row_wise_types(configs)
+    result = classify_model_types(configs["modelConfig.id"], configs["modelConfig.name"])
+    pd.testing.assert_series_equal(result, expected, check_dtype=False)
+
+
+def test_classify_model_types_treats_nan_like_missing(configs):
+    # Decoded batches can hold NaN where json_normalize gave None; both classify the same
+    with_nan = configs.assign(
+        **{
+            col: configs[col].map(lambda v: np.nan if v is None else v)
+            for col in ("modelConfig.id", "modelConfig.name")
+        }
+    )
+    expected = _row_wise_types(configs)
+    pd.testing.assert_series_equal(_row_wise_types(with_nan), expected)
+    result = classify_model_types(with_nan["modelConfig.id"], with_nan["modelConfig.name"])
+    pd.testing.assert_series_equal(result, expected, check_dtype=False)
+
+
+def test_classify_model_types_empty():
+    empty = pd.Series([], dtype=object)
+    assert classify_model_types(empty, empty).empty
+
+
+def test_extract_model_titles_matches_row_wise(configs):
+    df = configs.assign(model_type=_row_wise_types(configs))
+    expected = df.apply(extract_model_title, axis=1)
+    result = extract_model_titles(df)
+    pd.testing.assert_series_equal(result, expected.astype(object), check_dtype=False)
+
+
+def test_extract_model_titles_without_optional_columns():
+    df = pd.DataFrame({"model_type": ["t2i", "i2i", "t2s"], "modelConfig.id": ["t2i-flux", None, "x"]})
+    expected = df.apply(extract_model_title, axis=1)
+    result = extract_model_titles(df)
+    pd.testing.assert_series_equal(result, expected.astype(object), check_dtype=False)